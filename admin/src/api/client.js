@@ -1,5 +1,6 @@
 import axios from "axios";
 import { clearToken, getToken } from "../utils/auth.js";
+import { rememberReadPrimary, withReadPrimary } from "../utils/readPrimary.js";
 
 const api = axios.create({
   baseURL: import.meta.env.VITE_API_BASE_URL || "http://localhost:8001/api/v1",
@@ -11,11 +12,11 @@ api.interceptors.request.use((config) => {
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
-  return config;
+  return withReadPrimary(config);
 });
 
 api.interceptors.response.use(
-  (response) => response,
+  rememberReadPrimary,
   (error) => {
     if (error.response?.status === 401) {
       clearToken();
@@ -25,3 +26,8 @@ api.interceptors.response.use(
 );
 
 export default api;
+
+export const fetchPage = async (url, params = {}) => {
+  const response = await api.get(url, { params });
+  return { data: response.data, nextCursor: response.headers["x-next-cursor"] || null };
+};
@@ -0,0 +1,25 @@
+import { useCallback, useRef, useState } from "react";
+import { fetchPage } from "./client.js";
+
+// Loads a keyset-paginated list one page at a time. `reload` starts over from
+// the newest rows; `loadMore` appends the page after the last one loaded.
+export default function usePagedList(url, params = {}) {
+  const [items, setItems] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const paramsRef = useRef(params);
+
+  const reload = useCallback(async () => {
+    const page = await fetchPage(url, paramsRef.current);
+    setItems(page.data);
+    setNextCursor(page.nextCursor);
+  }, [url]);
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor) return;
+    const page = await fetchPage(url, { ...paramsRef.current, cursor: nextCursor });
+    setItems((prev) => [...prev, ...page.data]);
+    setNextCursor(page.nextCursor);
+  }, [url, nextCursor]);
+
+  return { items, hasMore: Boolean(nextCursor), reload, loadMore };
+}
@@ -0,0 +1,23 @@
+import { useState } from "react";
+
+export default function LoadMore({ hasMore, onLoadMore, label = "Load more" }) {
+  const [loading, setLoading] = useState(false);
+  if (!hasMore) return null;
+
+  const handleClick = async () => {
+    setLoading(true);
+    try {
+      await onLoadMore();
+    } finally {
+      setLoading(false);
+    }
+  };
+
+  return (
+    <div className="load-more">
+      <button className="btn btn-ghost" type="button" onClick={handleClick} disabled={loading}>
+        {loading ? "Loading..." : label}
+      </button>
+    </div>
+  );
+}
@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 const initialForm = {
   student_id: "",
@@ -16,8 +18,18 @@ const initialForm = {
 const gradeOptions = ["A+", "A", "B+", "B", "C", "D", "E", "F", "Pass", "Fail"];
 
 export default function Certificates() {
-  const [certificates, setCertificates] = useState([]);
-  const [students, setStudents] = useState([]);
+  const {
+    items: certificates,
+    hasMore: moreCertificates,
+    reload: fetchCertificates,
+    loadMore: loadMoreCertificates
+  } = usePagedList("/certificates");
+  const {
+    items: students,
+    hasMore: moreStudents,
+    reload: fetchStudents,
+    loadMore: loadMoreStudents
+  } = usePagedList("/students", { fields: "id,name" });
   const [courses, setCourses] = useState([]);
   const [formOpen, setFormOpen] = useState(false);
   const [form, setForm] = useState(initialForm);
@@ -31,16 +43,6 @@ export default function Certificates() {
     onConfirm: null
   });
 
-  const fetchCertificates = async () => {
-    const response = await api.get("/certificates");
-    setCertificates(response.data);
-  };
-
-  const fetchStudents = async () => {
-    const response = await api.get("/students");
-    setStudents(response.data);
-  };
-
   const fetchCourses = async () => {
     const response = await api.get("/courses", { params: { active_only: false } });
     setCourses(response.data);
@@ -223,6 +225,15 @@ export default function Certificates() {
                 </option>
               ))}
             </select>
+            <LoadMore
+              hasMore={moreStudents}
+              label="Load more students"
+              onLoadMore={() =>
+                loadMoreStudents().catch(() => {
+                  setStatus({ state: "error", message: "Unable to load more students." });
+                })
+              }
+            />
             <select
               name="course_id"
               value={form.course_id}
@@ -348,6 +359,14 @@ export default function Certificates() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreCertificates}
+        onLoadMore={() =>
+          loadMoreCertificates().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more certificates." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
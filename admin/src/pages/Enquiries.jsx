@@ -1,9 +1,16 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 export default function Enquiries() {
-  const [enquiries, setEnquiries] = useState([]);
+  const {
+    items: enquiries,
+    hasMore: moreEnquiries,
+    reload: fetchEnquiries,
+    loadMore: loadMoreEnquiries
+  } = usePagedList("/enquiries");
   const [status, setStatus] = useState({ state: "idle", message: "" });
   const [viewEnquiry, setViewEnquiry] = useState(null);
   const [confirmState, setConfirmState] = useState({
@@ -13,11 +20,6 @@ export default function Enquiries() {
     onConfirm: null
   });
 
-  const fetchEnquiries = async () => {
-    const response = await api.get("/enquiries");
-    setEnquiries(response.data);
-  };
-
   useEffect(() => {
     fetchEnquiries().catch(() => {
       setStatus({ state: "error", message: "Unable to load enquiries." });
@@ -145,6 +147,14 @@ export default function Enquiries() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreEnquiries}
+        onLoadMore={() =>
+          loadMoreEnquiries().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more enquiries." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
@@ -1,6 +1,8 @@
 import { useEffect, useMemo, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 const initialExamForm = {
   title: "",
@@ -29,7 +31,12 @@ const defaultOptions = [
 ];
 
 export default function Exams() {
-  const [exams, setExams] = useState([]);
+  const {
+    items: exams,
+    hasMore: moreExams,
+    reload: fetchExams,
+    loadMore: loadMoreExams
+  } = usePagedList("/exams");
   const [questions, setQuestions] = useState([]);
   const [selectedExam, setSelectedExam] = useState(null);
   const [formOpen, setFormOpen] = useState(false);
@@ -46,11 +53,6 @@ export default function Exams() {
     onConfirm: null
   });
 
-  const fetchExams = async () => {
-    const response = await api.get("/exams");
-    setExams(response.data);
-  };
-
   const fetchQuestions = async (examId) => {
     const response = await api.get(`/exams/${examId}/questions`);
     setQuestions(response.data);
@@ -417,6 +419,14 @@ export default function Exams() {
             )}
           </tbody>
         </table>
+        <LoadMore
+          hasMore={moreExams}
+          onLoadMore={() =>
+            loadMoreExams().catch(() => {
+              setStatus({ state: "error", message: "Unable to load more exams." });
+            })
+          }
+        />
       </div>
 
       <div className="panel">
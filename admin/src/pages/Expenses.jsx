@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 const initialForm = {
   title: "",
@@ -11,7 +13,12 @@ const initialForm = {
 };
 
 export default function Expenses() {
-  const [expenses, setExpenses] = useState([]);
+  const {
+    items: expenses,
+    hasMore: moreExpenses,
+    reload: fetchExpenses,
+    loadMore: loadMoreExpenses
+  } = usePagedList("/expenses");
   const [formOpen, setFormOpen] = useState(false);
   const [form, setForm] = useState(initialForm);
   const [status, setStatus] = useState({ state: "idle", message: "" });
@@ -24,11 +31,6 @@ export default function Expenses() {
     onConfirm: null
   });
 
-  const fetchExpenses = async () => {
-    const response = await api.get("/expenses");
-    setExpenses(response.data);
-  };
-
   useEffect(() => {
     fetchExpenses().catch(() => {
       setStatus({ state: "error", message: "Unable to load expenses." });
@@ -242,6 +244,14 @@ export default function Expenses() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreExpenses}
+        onLoadMore={() =>
+          loadMoreExpenses().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more expenses." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 const initialForm = {
   student_id: "",
@@ -11,8 +13,18 @@ const initialForm = {
 };
 
 export default function Fees() {
-  const [fees, setFees] = useState([]);
-  const [students, setStudents] = useState([]);
+  const {
+    items: fees,
+    hasMore: moreFees,
+    reload: fetchFees,
+    loadMore: loadMoreFees
+  } = usePagedList("/fees");
+  const {
+    items: students,
+    hasMore: moreStudents,
+    reload: fetchStudents,
+    loadMore: loadMoreStudents
+  } = usePagedList("/students", { fields: "id,name" });
   const [formOpen, setFormOpen] = useState(false);
   const [form, setForm] = useState(initialForm);
   const [status, setStatus] = useState({ state: "idle", message: "" });
@@ -25,16 +37,6 @@ export default function Fees() {
     onConfirm: null
   });
 
-  const fetchFees = async () => {
-    const response = await api.get("/fees");
-    setFees(response.data);
-  };
-
-  const fetchStudents = async () => {
-    const response = await api.get("/students");
-    setStudents(response.data);
-  };
-
   useEffect(() => {
     Promise.all([fetchFees(), fetchStudents()]).catch(() => {
       setStatus({ state: "error", message: "Unable to load fees." });
@@ -171,6 +173,15 @@ export default function Fees() {
                 </option>
               ))}
             </select>
+            <LoadMore
+              hasMore={moreStudents}
+              label="Load more students"
+              onLoadMore={() =>
+                loadMoreStudents().catch(() => {
+                  setStatus({ state: "error", message: "Unable to load more students." });
+                })
+              }
+            />
             <input
               name="amount"
               type="number"
@@ -257,6 +268,14 @@ export default function Fees() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreFees}
+        onLoadMore={() =>
+          loadMoreFees().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more fees." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 
 const initialForm = {
   media_type: "auto",
@@ -9,7 +11,12 @@ const initialForm = {
 };
 
 export default function Gallery() {
-  const [items, setItems] = useState([]);
+  const {
+    items: items,
+    hasMore: moreItems,
+    reload: fetchGallery,
+    loadMore: loadMoreGallery
+  } = usePagedList("/gallery", { active_only: false });
   const [formOpen, setFormOpen] = useState(false);
   const [form, setForm] = useState(initialForm);
   const [file, setFile] = useState(null);
@@ -32,11 +39,6 @@ export default function Gallery() {
     return `${mediaBase}${url}`;
   };
 
-  const fetchGallery = async () => {
-    const response = await api.get("/gallery", { params: { active_only: false } });
-    setItems(response.data);
-  };
-
   useEffect(() => {
     fetchGallery().catch(() => {
       setStatus({ state: "error", message: "Unable to load gallery items." });
@@ -292,6 +294,14 @@ export default function Gallery() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreItems}
+        onLoadMore={() =>
+          loadMoreGallery().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more gallery items." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
@@ -1,6 +1,8 @@
 import { useEffect, useState } from "react";
 import api from "../api/client.js";
+import usePagedList from "../api/usePagedList.js";
 import ConfirmDialog from "../components/ConfirmDialog.jsx";
+import LoadMore from "../components/LoadMore.jsx";
 import PromptDialog from "../components/PromptDialog.jsx";
 
 const initialForm = {
@@ -17,7 +19,12 @@ const initialForm = {
 };
 
 export default function Students() {
-  const [students, setStudents] = useState([]);
+  const {
+    items: students,
+    hasMore: moreStudents,
+    reload: fetchStudents,
+    loadMore: loadMoreStudents
+  } = usePagedList("/students");
   const [courses, setCourses] = useState([]);
   const [formOpen, setFormOpen] = useState(false);
   const [form, setForm] = useState(initialForm);
@@ -46,11 +53,6 @@ export default function Students() {
     return `${mediaBase}${url}`;
   };
 
-  const fetchStudents = async () => {
-    const response = await api.get("/students");
-    setStudents(response.data);
-  };
-
   const fetchCourses = async () => {
     const response = await api.get("/courses", { params: { active_only: false } });
     setCourses(response.data);
@@ -414,6 +416,14 @@ export default function Students() {
           )}
         </tbody>
       </table>
+      <LoadMore
+        hasMore={moreStudents}
+        onLoadMore={() =>
+          loadMoreStudents().catch(() => {
+            setStatus({ state: "error", message: "Unable to load more students." });
+          })
+        }
+      />
       <ConfirmDialog
         open={confirmState.open}
         title={confirmState.title}
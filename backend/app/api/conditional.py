@@ -0,0 +1,31 @@
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db
+from app.api.response_cache import etag_matches
+from app.services.versions import read_versions, track
+
+
+def collection_etag(*models):
+    """Dependency answering ``If-None-Match`` from per-table version counters.
+
+    The ETag combines the request path and query with the current version of
+    every table the response reads, so a match is answered with 304 before
+    the route loads or serializes any rows.
+    """
+    names = sorted({model.__tablename__ for model in models})
+    track(names)
+
+    def check(request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        versions = read_versions(db, names)
+        token = ";".join(f"{name}={versions[name]}" for name in names)
+        digest = hashlib.md5(f"{request.url.path}?{request.url.query}|{token}".encode()).hexdigest()
+        etag = f'W/"{digest}"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+        if etag_matches(request, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+    return Depends(check)
@@ -1,12 +1,14 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import decode_access_token
-from app.db.session import SessionLocal
+from app.core.security import InvalidToken, decode_access_token
+from app.db.replicas import read_session_factory
+from app.db.session import AsyncSessionLocal, SessionLocal
 from app.models.student import Student
 from app.models.user import User
+from app.services.principals import get_principal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 student_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/student-auth/login")
@@ -20,14 +22,25 @@ def get_db():
         db.close()
 
 
+async def get_async_db() -> AsyncSession:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request) -> AsyncSession:
+    """Session for read-only endpoints; served by a replica when one is configured."""
+    async with read_session_factory(request)() as db:
+        yield db
+
+
 def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
     try:
         payload = decode_access_token(token)
         user_id = int(payload.get("sub"))
-    except (JWTError, TypeError, ValueError):
+    except (InvalidToken, TypeError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = get_principal(db, User, user_id)
     if not user or not user.is_active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user")
     return user
@@ -43,10 +56,10 @@ def get_current_student(
         if not subject or not str(subject).startswith("student:"):
             raise ValueError("Invalid subject")
         student_id = int(str(subject).split(":", 1)[1])
-    except (JWTError, TypeError, ValueError):
+    except (InvalidToken, TypeError, ValueError):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
-    student = db.query(Student).filter(Student.id == student_id).first()
+    student = get_principal(db, Student, student_id)
     if not student or not student.login_enabled:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive student")
     return student
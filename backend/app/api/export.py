@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Iterator, Type
+
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query as SAQuery, Session
+
+from app.db.base import Base
+from app.db.session import SessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+ExportFormat = Query("csv", regex="^(csv|ndjson)$")
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def export_columns(model: Type[Base], schema: Type[BaseModel]) -> list[str]:
+    table_columns = model.__table__.columns.keys()
+    return ["id", *(name for name in schema.__fields__ if name in table_columns and name != "id")]
+
+
+def _iter_rows(build_query: Callable[[Session], SAQuery], model: Type[Base], columns: list[str]) -> Iterator[tuple]:
+    # The request-scoped session is closed before the body is streamed, so
+    # the export owns its own session for the lifetime of the generator.
+    db = SessionLocal()
+    try:
+        query = (
+            build_query(db)
+            .with_entities(*(getattr(model, name) for name in columns))
+            .order_by(model.id)
+            .execution_options(stream_results=True)
+            .yield_per(EXPORT_BATCH_SIZE)
+        )
+        yield from query
+    finally:
+        db.close()
+
+
+def _csv_stream(rows: Iterator[tuple], columns: list[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+
+    buffer.seek(0)
+    buffer.truncate()
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_stream(rows: Iterator[tuple], columns: list[str]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(dict(zip(columns, row)), default=_json_default) + "\n"
+
+
+def export_response(
+    build_query: Callable[[Session], SAQuery],
+    model: Type[Base],
+    schema: Type[BaseModel],
+    fmt: str,
+    filename: str,
+) -> StreamingResponse:
+    """Stream every row matched by ``build_query`` as CSV or NDJSON, oldest first."""
+    columns = export_columns(model, schema)
+    rows = _iter_rows(build_query, model, columns)
+    body = _csv_stream(rows, columns) if fmt == "csv" else _ndjson_stream(rows, columns)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,70 @@
+from typing import Type
+
+from fastapi import HTTPException, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import Query as SAQuery
+
+from app.core.config import settings
+from app.db.base import Base
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """Keyset pagination on ``id`` (newest first) with optional field projection."""
+
+    def __init__(
+        self,
+        cursor: int | None = Query(None, ge=1, description="Return rows with id below this value"),
+        limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+        fields: str | None = Query(None, description="Comma separated fields to return"),
+    ) -> None:
+        self.cursor = cursor
+        self.limit = limit
+        self.fields = [name.strip() for name in fields.split(",") if name.strip()] if fields else None
+
+
+def _projected_columns(model: Type[Base], schema: Type[BaseModel], fields: list[str]) -> list:
+    allowed = set(schema.__fields__) & set(model.__table__.columns.keys())
+    unknown = [name for name in fields if name not in allowed]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    if "id" not in fields:
+        fields = ["id", *fields]
+    return [getattr(model, name) for name in fields]
+
+
+def paginate(
+    query: SAQuery,
+    model: Type[Base],
+    schema: Type[BaseModel],
+    page: PageParams,
+    response: Response,
+):
+    """Apply ``page`` to ``query`` and return one page of rows.
+
+    The id to pass as ``cursor`` for the next page is sent in the
+    ``X-Next-Cursor`` header; it is absent on the last page. With ``fields``
+    only those columns are selected and the rows bypass ``schema``.
+    """
+    if page.cursor:
+        query = query.filter(model.id < page.cursor)
+    query = query.order_by(model.id.desc()).limit(page.limit + 1)
+
+    if page.fields:
+        columns = _projected_columns(model, schema, page.fields)
+        rows = [dict(row._mapping) for row in query.with_entities(*columns)]
+        last_id = rows[page.limit - 1]["id"] if len(rows) > page.limit else None
+        rows = rows[: page.limit]
+        headers = dict(response.headers)
+        if last_id:
+            headers[NEXT_CURSOR_HEADER] = str(last_id)
+        return JSONResponse(content=jsonable_encoder(rows), headers=headers)
+
+    rows = query.all()
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        response.headers[NEXT_CURSOR_HEADER] = str(rows[-1].id)
+    return rows
@@ -0,0 +1,132 @@
+import hashlib
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Type
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.db.replicas import pinned_to_primary
+
+PASSTHROUGH_HEADERS = ("x-next-cursor",)
+
+_caches: dict[str, LRUCache] = {}
+
+
+def _cache(namespace: str) -> LRUCache:
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches.setdefault(
+            namespace,
+            LRUCache(maxsize=settings.CATALOG_CACHE_SIZE, ttl=settings.CATALOG_CACHE_TTL_SECONDS),
+        )
+    return cache
+
+
+def invalidate(namespace: str) -> None:
+    cache = _caches.get(namespace)
+    if cache is not None:
+        cache.clear()
+
+
+def json_response(data: Any, schema: Type[BaseModel]) -> JSONResponse:
+    if isinstance(data, list):
+        content = [schema.from_orm(item) for item in data]
+    else:
+        content = schema.from_orm(data)
+    return JSONResponse(content=jsonable_encoder(content))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def not_modified(request: Request, etag: str, last_modified: float | None = None) -> bool:
+    if request.headers.get("if-none-match"):
+        return etag_matches(request, etag)
+    since = request.headers.get("if-modified-since")
+    if since and last_modified is not None:
+        try:
+            return parsedate_to_datetime(since).timestamp() >= int(last_modified)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _cache_key(request: Request) -> tuple:
+    return (request.url.path, tuple(sorted(request.query_params.multi_items())))
+
+
+def _store(cache: LRUCache, key: tuple, response: Response) -> dict:
+    body = bytes(response.body)
+    headers = {name: response.headers[name] for name in PASSTHROUGH_HEADERS if name in response.headers}
+    entry = {
+        "body": body,
+        "media_type": response.media_type,
+        "headers": headers,
+        "etag": f'"{hashlib.md5(body).hexdigest()}"',
+        "last_modified": time.time(),
+    }
+    cache.set(key, entry)
+    return entry
+
+
+def _serve(request: Request, entry: dict) -> Response:
+    headers = {
+        **entry["headers"],
+        "ETag": entry["etag"],
+        "Last-Modified": formatdate(entry["last_modified"], usegmt=True),
+        # Clients always revalidate: admins refetch these URLs right after writing,
+        # and the ETag turns the revalidation into a cheap 304.
+        "Cache-Control": "public, no-cache",
+    }
+    if not_modified(request, entry["etag"], entry["last_modified"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry["body"], media_type=entry["media_type"], headers=headers)
+
+
+def cached_response(request: Request, namespace: str, render: Callable[[], Response]) -> Response:
+    """Serve a public GET from a short-TTL cache, answering revalidations with 304.
+
+    ``render`` is only called on a miss. Entries are keyed by path and query
+    string and dropped early by ``invalidate(namespace)`` from write handlers.
+    """
+    cache = _cache(namespace)
+    key = _cache_key(request)
+    entry = cache.get(key)
+    if entry is None:
+        response = render()
+        if response.status_code != 200:
+            return response
+        entry = _store(cache, key, response)
+    return _serve(request, entry)
+
+
+async def cached_response_async(
+    request: Request,
+    namespace: str,
+    render: Callable[[], Awaitable[Response]],
+) -> Response:
+    """Same as ``cached_response`` for async routes whose ``render`` awaits the database.
+
+    A client pinned to the primary after a write skips the lookup, since the
+    entry may have been refilled from a lagging replica since its write; its
+    fresh render replaces the entry.
+    """
+    cache = _cache(namespace)
+    key = _cache_key(request)
+    entry = None if pinned_to_primary(request) else cache.get(key)
+    if entry is None:
+        response = await render()
+        if response.status_code != 200:
+            return response
+        entry = _store(cache, key, response)
+    return _serve(request, entry)
@@ -1,43 +1,97 @@
 from datetime import timedelta
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_current_user, get_db
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    benchmark_password_hash_async,
+    create_access_token,
+    get_password_hash_async,
+    password_pool_stats,
+    verify_and_update_password_async,
+)
 from app.models.user import User
-from app.schemas.auth import LoginRequest, Token
+from app.schemas.auth import LoginRequest, PasswordBenchmark, PasswordPoolStats, Token
 from app.schemas.user import UserCreate, UserOut
 
 router = APIRouter()
 
 
 @router.post("/register", response_model=UserOut)
-def register_user(payload: UserCreate, db: Session = Depends(get_db)):
-    existing = db.query(User).filter(User.email == payload.email).first()
+async def register_user(payload: UserCreate, db: Session = Depends(get_db)):
+    existing = await run_in_threadpool(lambda: db.query(User).filter(User.email == payload.email).first())
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     user = User(
         name=payload.name,
         email=payload.email,
-        hashed_password=get_password_hash(payload.password),
+        hashed_password=await get_password_hash_async(payload.password),
         role=payload.role,
         is_active=payload.is_active,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+
+    def save():
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+
+    await run_in_threadpool(save)
     return user
 
 
 @router.post("/login", response_model=Token)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.hashed_password):
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(lambda: db.query(User).filter(User.email == payload.email).first())
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = await verify_and_update_password_async(payload.password, user.hashed_password)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    # Read the id before committing: the commit expires the instance and a
+    # later attribute access would reload it synchronously on the event loop.
+    user_id = user.id
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(db.commit)
 
     token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = create_access_token(subject=str(user.id), expires_delta=token_expires)
+    token = create_access_token(subject=str(user_id), expires_delta=token_expires)
     return Token(access_token=token)
+
+
+@router.get("/password-pool", response_model=PasswordPoolStats, dependencies=[Depends(get_current_user)])
+def get_password_pool_stats():
+    return password_pool_stats()
+
+
+@router.get("/password-benchmark", response_model=PasswordBenchmark, dependencies=[Depends(get_current_user)])
+async def run_password_benchmark(rounds: Optional[List[int]] = Query(None)):
+    configured = {
+        settings.BCRYPT_ROUNDS_STAFF: ["staff"],
+        settings.BCRYPT_ROUNDS_STUDENT: ["student"],
+    }
+    if settings.BCRYPT_ROUNDS_STAFF == settings.BCRYPT_ROUNDS_STUDENT:
+        configured[settings.BCRYPT_ROUNDS_STAFF] = ["staff", "student"]
+    candidates = sorted(set(configured) | set(rounds or []))
+    if any(value < 4 or value > 15 for value in candidates):
+        raise HTTPException(status_code=400, detail="Rounds must be between 4 and 15")
+
+    results = []
+    for value in candidates:
+        results.append(
+            {
+                "rounds": value,
+                "milliseconds": await benchmark_password_hash_async(value),
+                "accounts": configured.get(value, []),
+            }
+        )
+    return PasswordBenchmark(
+        staff_rounds=settings.BCRYPT_ROUNDS_STAFF,
+        student_rounds=settings.BCRYPT_ROUNDS_STUDENT,
+        results=results,
+    )
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.conditional import collection_etag
+from app.api.deps import get_async_db, get_async_read_db, get_current_user, get_db
+from app.api.pagination import PageParams, paginate
 from app.models.certificate import Certificate
 from app.models.course import Course
 from app.models.student import Student
@@ -11,9 +15,13 @@ from app.schemas.certificate_verify import CertificateVerifyRequest, Certificate
 router = APIRouter()
 
 
-@router.get("/", response_model=list[CertificateOut], dependencies=[Depends(get_current_user)])
-def list_certificates(db: Session = Depends(get_db)):
-    return db.query(Certificate).order_by(Certificate.id.desc()).all()
+@router.get(
+    "/",
+    response_model=list[CertificateOut],
+    dependencies=[Depends(get_current_user), collection_etag(Certificate)],
+)
+def list_certificates(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Certificate), Certificate, CertificateOut, page, response)
 
 
 @router.post("/", response_model=CertificateOut, dependencies=[Depends(get_current_user)])
@@ -44,13 +52,13 @@ def update_certificate(certificate_id: int, payload: CertificateUpdate, db: Sess
 
 
 @router.get("/verify/{code}")
-def verify_certificate(code: str, db: Session = Depends(get_db)):
-    certificate = db.query(Certificate).filter(Certificate.certificate_code == code).first()
+async def verify_certificate(code: str, db: AsyncSession = Depends(get_async_read_db)):
+    certificate = await db.scalar(select(Certificate).where(Certificate.certificate_code == code).limit(1))
     if not certificate:
         raise HTTPException(status_code=404, detail="Certificate not found")
 
-    student = db.query(Student).filter(Student.id == certificate.student_id).first()
-    course = db.query(Course).filter(Course.id == certificate.course_id).first()
+    student = await db.get(Student, certificate.student_id) if certificate.student_id else None
+    course = await db.get(Course, certificate.course_id) if certificate.course_id else None
     return {
         "certificate_code": certificate.certificate_code,
         "status": certificate.status,
@@ -71,25 +79,28 @@ def verify_certificate(code: str, db: Session = Depends(get_db)):
 
 
 @router.post("/verify/enrollment", response_model=CertificateVerifyResponse)
-def verify_certificate_by_enrollment(payload: CertificateVerifyRequest, db: Session = Depends(get_db)):
-    student = (
-        db.query(Student)
-        .filter(Student.enrollment_no == payload.enrollment_no, Student.dob == payload.dob)
-        .first()
+async def verify_certificate_by_enrollment(
+    payload: CertificateVerifyRequest,
+    db: AsyncSession = Depends(get_async_db),
+):
+    student = await db.scalar(
+        select(Student)
+        .where(Student.enrollment_no == payload.enrollment_no, Student.dob == payload.dob)
+        .limit(1)
     )
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    certificate = (
-        db.query(Certificate)
-        .filter(Certificate.student_id == student.id)
+    certificate = await db.scalar(
+        select(Certificate)
+        .where(Certificate.student_id == student.id)
         .order_by(Certificate.id.desc())
-        .first()
+        .limit(1)
     )
     if not certificate:
         raise HTTPException(status_code=404, detail="Certificate not found")
 
-    course = db.query(Course).filter(Course.id == certificate.course_id).first()
+    course = await db.get(Course, certificate.course_id) if certificate.course_id else None
     return CertificateVerifyResponse(
         enrollment_no=student.enrollment_no or payload.enrollment_no,
         student_name=student.name,
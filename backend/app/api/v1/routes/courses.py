@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_async_db, get_async_read_db, get_current_user, get_db
+from app.api.response_cache import cached_response_async, invalidate, json_response
 from app.models.course import Course
 from app.schemas.course import CourseCreate, CourseOut, CourseUpdate
 
@@ -9,25 +12,33 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[CourseOut])
-def list_courses(
+async def list_courses(
+    request: Request,
     active_only: bool = True,
     trade_id: int | None = None,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    query = db.query(Course)
-    if active_only:
-        query = query.filter(Course.is_active.is_(True))
-    if trade_id:
-        query = query.filter(Course.trade_id == trade_id)
-    return query.order_by(Course.id.desc()).all()
+    async def render():
+        query = select(Course)
+        if active_only:
+            query = query.where(Course.is_active.is_(True))
+        if trade_id:
+            query = query.where(Course.trade_id == trade_id)
+        courses = (await db.scalars(query.order_by(Course.id.desc()))).all()
+        return json_response(courses, CourseOut)
+
+    return await cached_response_async(request, "courses", render)
 
 
 @router.get("/{course_id}", response_model=CourseOut)
-def get_course(course_id: int, db: Session = Depends(get_db)):
-    course = db.query(Course).filter(Course.id == course_id).first()
-    if not course:
-        raise HTTPException(status_code=404, detail="Course not found")
-    return course
+async def get_course(course_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    async def render():
+        course = await db.get(Course, course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return json_response(course, CourseOut)
+
+    return await cached_response_async(request, "courses", render)
 
 
 @router.post("/", response_model=CourseOut, dependencies=[Depends(get_current_user)])
@@ -35,6 +46,7 @@ def create_course(payload: CourseCreate, db: Session = Depends(get_db)):
     course = Course(**payload.dict())
     db.add(course)
     db.commit()
+    invalidate("courses")
     db.refresh(course)
     return course
 
@@ -49,6 +61,7 @@ def update_course(course_id: int, payload: CourseUpdate, db: Session = Depends(g
         setattr(course, key, value)
 
     db.commit()
+    invalidate("courses")
     db.refresh(course)
     return course
 
@@ -61,4 +74,5 @@ def delete_course(course_id: int, db: Session = Depends(get_db)):
 
     db.delete(course)
     db.commit()
+    invalidate("courses")
     return {"status": "deleted"}
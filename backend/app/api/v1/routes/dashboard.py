@@ -1,16 +1,21 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy import func
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
+from app.api.conditional import collection_etag
 from app.api.deps import get_current_user, get_db
 from app.models.certificate import Certificate
 from app.models.course import Course
+from app.models.dashboard import DashboardCounter
 from app.models.enquiry import Enquiry
 from app.models.expense import Expense
 from app.models.fee import Fee
 from app.models.gallery import Gallery
 from app.models.student import Student
-from app.schemas.dashboard import DashboardSummary
+from app.schemas.dashboard import DashboardSummary, FinanceSummary
+from app.services.counters import read_counters
+from app.services.rollups import finance_summary
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
@@ -21,22 +26,31 @@ def _to_float(value) -> float:
     return float(value)
 
 
-@router.get("/summary", response_model=DashboardSummary)
+@router.get(
+    "/summary",
+    response_model=DashboardSummary,
+    dependencies=[
+        collection_etag(Student, Course, Enquiry, Certificate, Gallery, Fee, Expense, DashboardCounter),
+    ],
+)
 def get_summary(db: Session = Depends(get_db)):
-    total_students = db.query(func.count(Student.id)).scalar() or 0
-    total_courses = db.query(func.count(Course.id)).scalar() or 0
-    total_enquiries = db.query(func.count(Enquiry.id)).scalar() or 0
-    total_fees = db.query(func.coalesce(func.sum(Fee.amount), 0)).scalar()
-    total_expenses = db.query(func.coalesce(func.sum(Expense.amount), 0)).scalar()
-    total_certificates = db.query(func.count(Certificate.id)).scalar() or 0
-    total_gallery_items = db.query(func.count(Gallery.id)).scalar() or 0
-
+    counters = read_counters(db)
     return DashboardSummary(
-        total_students=total_students,
-        total_courses=total_courses,
-        total_enquiries=total_enquiries,
-        total_fees=_to_float(total_fees),
-        total_expenses=_to_float(total_expenses),
-        total_certificates=total_certificates,
-        total_gallery_items=total_gallery_items,
+        total_students=int(counters["total_students"]),
+        total_courses=int(counters["total_courses"]),
+        total_enquiries=int(counters["total_enquiries"]),
+        total_fees=_to_float(counters["total_fees"]),
+        total_expenses=_to_float(counters["total_expenses"]),
+        total_certificates=int(counters["total_certificates"]),
+        total_gallery_items=int(counters["total_gallery_items"]),
     )
+
+
+@router.get("/finance", response_model=FinanceSummary, dependencies=[collection_etag(Fee, Expense)])
+def get_finance(
+    start: date | None = None,
+    end: date | None = None,
+    granularity: str = Query("month", regex="^(day|month)$"),
+    db: Session = Depends(get_db),
+):
+    return finance_summary(db, start, end, granularity)
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.api.conditional import collection_etag
 from app.api.deps import get_current_user, get_db
+from app.api.pagination import PageParams, paginate
 from app.models.enquiry import Enquiry
 from app.schemas.enquiry import EnquiryCreate, EnquiryOut
 
@@ -17,9 +19,13 @@ def create_enquiry(payload: EnquiryCreate, db: Session = Depends(get_db)):
     return enquiry
 
 
-@router.get("/", response_model=list[EnquiryOut], dependencies=[Depends(get_current_user)])
-def list_enquiries(db: Session = Depends(get_db)):
-    return db.query(Enquiry).order_by(Enquiry.id.desc()).all()
+@router.get(
+    "/",
+    response_model=list[EnquiryOut],
+    dependencies=[Depends(get_current_user), collection_etag(Enquiry)],
+)
+def list_enquiries(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Enquiry), Enquiry, EnquiryOut, page, response)
 
 
 @router.delete("/{enquiry_id}", dependencies=[Depends(get_current_user)])
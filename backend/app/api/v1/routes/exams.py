@@ -1,14 +1,19 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import and_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
+from sqlalchemy import and_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_student, get_current_user, get_db
-from app.models.exam import Exam, ExamAnswer, ExamAttempt, ExamOption, ExamQuestion
+from app.api.conditional import collection_etag
+from app.api.deps import get_async_db, get_async_read_db, get_current_student, get_current_user, get_db
+from app.api.pagination import PageParams, paginate
+from app.models.exam import Exam, ExamAttempt, ExamOption, ExamQuestion
 from app.schemas.exam import (
+    ExamAnalytics,
     ExamAnswerSubmit,
     ExamAttemptOut,
+    ExamAutosaveRequest,
     ExamCreate,
     ExamOut,
     ExamOptionOut,
@@ -16,18 +21,35 @@ from app.schemas.exam import (
     ExamQuestionCreate,
     ExamQuestionOut,
     ExamQuestionUpdate,
+    ExamRegradeStatus,
     ExamStartResponse,
     ExamSubmitRequest,
     ExamSubmitResponse,
     ExamUpdate,
 )
+from app.services.analytics import get_exam_analytics
+from app.services.autosave import buffer_answers, saved_answers, take_answers
+from app.services.exam_paper import (
+    bump_exam_version,
+    get_paper,
+    invalidate_paper,
+    question_out,
+    render_start_response,
+)
+from app.services.exam_sweeper import attempt_deadline
+from app.services.grading import get_answer_key, save_answers
+from app.services.regrade import create_job, get_job, run_regrade
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[ExamOut], dependencies=[Depends(get_current_user)])
-def list_exams(db: Session = Depends(get_db)):
-    return db.query(Exam).order_by(Exam.id.desc()).all()
+def _question_exam_id(db: Session, question_id: int) -> int | None:
+    return db.query(ExamQuestion.exam_id).filter(ExamQuestion.id == question_id).scalar()
+
+
+@router.get("/", response_model=list[ExamOut], dependencies=[Depends(get_current_user), collection_etag(Exam)])
+def list_exams(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Exam), Exam, ExamOut, page, response)
 
 
 @router.post("/", response_model=ExamOut, dependencies=[Depends(get_current_user)])
@@ -39,7 +61,7 @@ def create_exam(payload: ExamCreate, db: Session = Depends(get_db)):
     return exam
 
 
-@router.get("/{exam_id}", response_model=ExamOut, dependencies=[Depends(get_current_user)])
+@router.get("/{exam_id}", response_model=ExamOut, dependencies=[Depends(get_current_user), collection_etag(Exam)])
 def get_exam(exam_id: int, db: Session = Depends(get_db)):
     exam = db.query(Exam).filter(Exam.id == exam_id).first()
     if not exam:
@@ -55,8 +77,10 @@ def update_exam(exam_id: int, payload: ExamUpdate, db: Session = Depends(get_db)
 
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(exam, key, value)
+    exam.content_version = (exam.content_version or 0) + 1
 
     db.commit()
+    invalidate_paper(exam_id)
     db.refresh(exam)
     return exam
 
@@ -73,32 +97,56 @@ def delete_exam(exam_id: int, db: Session = Depends(get_db)):
     db.query(ExamQuestion).filter(ExamQuestion.exam_id == exam_id).delete()
     db.delete(exam)
     db.commit()
+    invalidate_paper(exam_id)
     return {"status": "deleted"}
 
 
-@router.get("/{exam_id}/questions", response_model=list[ExamQuestionOut], dependencies=[Depends(get_current_user)])
+@router.get("/{exam_id}/analytics", response_model=ExamAnalytics, dependencies=[Depends(get_current_user)])
+def get_analytics(exam_id: int, db: Session = Depends(get_db)):
+    exam = db.query(Exam).filter(Exam.id == exam_id).first()
+    if not exam:
+        raise HTTPException(status_code=404, detail="Exam not found")
+    return get_exam_analytics(db, exam)
+
+
+@router.post("/{exam_id}/regrade", response_model=ExamRegradeStatus, dependencies=[Depends(get_current_user)])
+def start_regrade(exam_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    exam = db.query(Exam).filter(Exam.id == exam_id).first()
+    if not exam:
+        raise HTTPException(status_code=404, detail="Exam not found")
+
+    job = create_job(db, exam_id)
+    if not job:
+        raise HTTPException(status_code=409, detail="Regrade already in progress")
+    background_tasks.add_task(run_regrade, exam_id)
+    return job
+
+
+@router.get("/{exam_id}/regrade", response_model=ExamRegradeStatus, dependencies=[Depends(get_current_user)])
+def get_regrade_status(exam_id: int, db: Session = Depends(get_db)):
+    job = get_job(db, exam_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="No regrade job for this exam")
+    return job
+
+
+@router.get(
+    "/{exam_id}/questions",
+    response_model=list[ExamQuestionOut],
+    dependencies=[Depends(get_current_user), collection_etag(Exam, ExamQuestion, ExamOption)],
+)
 def list_questions(exam_id: int, db: Session = Depends(get_db)):
     exam = db.query(Exam).filter(Exam.id == exam_id).first()
     if not exam:
         raise HTTPException(status_code=404, detail="Exam not found")
 
-    questions = db.query(ExamQuestion).filter(ExamQuestion.exam_id == exam_id).all()
-    results = []
-    for question in questions:
-        options = db.query(ExamOption).filter(ExamOption.question_id == question.id).all()
-        results.append(
-            ExamQuestionOut(
-                id=question.id,
-                question_text=question.question_text,
-                marks=float(question.marks) if question.marks is not None else 1,
-                negative_marks=float(question.negative_marks) if question.negative_marks is not None else None,
-                options=[
-                    {"id": opt.id, "option_text": opt.option_text, "is_correct": opt.is_correct}
-                    for opt in options
-                ],
-            )
-        )
-    return results
+    questions = (
+        db.query(ExamQuestion)
+        .filter(ExamQuestion.exam_id == exam_id)
+        .order_by(ExamQuestion.id)
+        .all()
+    )
+    return [question_out(question) for question in questions]
 
 
 @router.post("/{exam_id}/questions", response_model=ExamQuestionOut, dependencies=[Depends(get_current_user)])
@@ -127,17 +175,11 @@ def create_question(exam_id: int, payload: ExamQuestionCreate, db: Session = Dep
         )
         db.add(option)
 
+    bump_exam_version(db, exam_id)
     db.commit()
+    invalidate_paper(exam_id)
     db.refresh(question)
-
-    options = db.query(ExamOption).filter(ExamOption.question_id == question.id).all()
-    return ExamQuestionOut(
-        id=question.id,
-        question_text=question.question_text,
-        marks=float(question.marks) if question.marks is not None else 1,
-        negative_marks=float(question.negative_marks) if question.negative_marks is not None else None,
-        options=[{"id": opt.id, "option_text": opt.option_text, "is_correct": opt.is_correct} for opt in options],
-    )
+    return question_out(question)
 
 
 @router.put("/questions/{question_id}", response_model=ExamQuestionOut, dependencies=[Depends(get_current_user)])
@@ -149,16 +191,11 @@ def update_question(question_id: int, payload: ExamQuestionUpdate, db: Session =
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(question, key, value)
 
+    bump_exam_version(db, question.exam_id)
     db.commit()
+    invalidate_paper(question.exam_id)
     db.refresh(question)
-    options = db.query(ExamOption).filter(ExamOption.question_id == question.id).all()
-    return ExamQuestionOut(
-        id=question.id,
-        question_text=question.question_text,
-        marks=float(question.marks) if question.marks is not None else 1,
-        negative_marks=float(question.negative_marks) if question.negative_marks is not None else None,
-        options=[{"id": opt.id, "option_text": opt.option_text, "is_correct": opt.is_correct} for opt in options],
-    )
+    return question_out(question)
 
 
 @router.delete("/questions/{question_id}", dependencies=[Depends(get_current_user)])
@@ -167,9 +204,12 @@ def delete_question(question_id: int, db: Session = Depends(get_db)):
     if not question:
         raise HTTPException(status_code=404, detail="Question not found")
 
+    exam_id = question.exam_id
     db.query(ExamOption).filter(ExamOption.question_id == question_id).delete()
     db.delete(question)
+    bump_exam_version(db, exam_id)
     db.commit()
+    invalidate_paper(exam_id)
     return {"status": "deleted"}
 
 
@@ -181,7 +221,9 @@ def add_option(question_id: int, option_text: str, is_correct: bool = False, db:
 
     option = ExamOption(question_id=question_id, option_text=option_text, is_correct=is_correct)
     db.add(option)
+    bump_exam_version(db, question.exam_id)
     db.commit()
+    invalidate_paper(question.exam_id)
     db.refresh(option)
     return {"id": option.id, "option_text": option.option_text, "is_correct": option.is_correct}
 
@@ -208,7 +250,10 @@ def update_option(
     for key, value in payload.dict(exclude_unset=True).items():
         setattr(option, key, value)
 
+    exam_id = _question_exam_id(db, question_id)
+    bump_exam_version(db, exam_id)
     db.commit()
+    invalidate_paper(exam_id)
     db.refresh(option)
     return option
 
@@ -226,35 +271,38 @@ def delete_option(question_id: int, option_id: int, db: Session = Depends(get_db
     if not option:
         raise HTTPException(status_code=404, detail="Option not found")
 
+    exam_id = _question_exam_id(db, question_id)
     db.delete(option)
+    bump_exam_version(db, exam_id)
     db.commit()
+    invalidate_paper(exam_id)
     return {"status": "deleted"}
 
 
 @router.get("/student/available", response_model=list[ExamOut], dependencies=[Depends(get_current_student)])
-def list_available_exams(db: Session = Depends(get_db)):
+async def list_available_exams(db: AsyncSession = Depends(get_async_read_db)):
     now = datetime.utcnow()
-    query = db.query(Exam).filter(Exam.is_active.is_(True))
-    query = query.filter(
+    query = select(Exam).where(Exam.is_active.is_(True))
+    query = query.where(
         and_(
             (Exam.start_at.is_(None) | (Exam.start_at <= now)),
             (Exam.end_at.is_(None) | (Exam.end_at >= now)),
         )
     )
-    return query.order_by(Exam.id.desc()).all()
+    return (await db.scalars(query.order_by(Exam.id.desc()))).all()
 
 
 @router.post("/{exam_id}/start", response_model=ExamStartResponse, dependencies=[Depends(get_current_student)])
-def start_exam(exam_id: int, db: Session = Depends(get_db), student=Depends(get_current_student)):
-    exam = db.query(Exam).filter(Exam.id == exam_id, Exam.is_active.is_(True)).first()
+async def start_exam(exam_id: int, db: AsyncSession = Depends(get_async_db), student=Depends(get_current_student)):
+    exam = await db.scalar(select(Exam).where(Exam.id == exam_id, Exam.is_active.is_(True)))
     if not exam:
         raise HTTPException(status_code=404, detail="Exam not found")
 
-    attempt = (
-        db.query(ExamAttempt)
-        .filter(ExamAttempt.exam_id == exam_id, ExamAttempt.student_id == student.id)
+    attempt = await db.scalar(
+        select(ExamAttempt)
+        .where(ExamAttempt.exam_id == exam_id, ExamAttempt.student_id == student.id)
         .order_by(ExamAttempt.id.desc())
-        .first()
+        .limit(1)
     )
     if attempt and attempt.status == "submitted":
         raise HTTPException(status_code=400, detail="Exam already submitted")
@@ -262,30 +310,19 @@ def start_exam(exam_id: int, db: Session = Depends(get_db), student=Depends(get_
     if not attempt:
         attempt = ExamAttempt(exam_id=exam_id, student_id=student.id, status="in_progress")
         db.add(attempt)
-        db.commit()
-        db.refresh(attempt)
-
-    questions = db.query(ExamQuestion).filter(ExamQuestion.exam_id == exam_id).all()
-    question_out = []
-    for q in questions:
-        options = db.query(ExamOption).filter(ExamOption.question_id == q.id).all()
-        question_out.append(
-            {
-                "id": q.id,
-                "question_text": q.question_text,
-                "marks": float(q.marks) if q.marks is not None else 1,
-                "negative_marks": float(q.negative_marks) if q.negative_marks is not None else None,
-                "options": [{"id": opt.id, "option_text": opt.option_text, "is_correct": False} for opt in options],
-            }
-        )
+        await db.commit()
 
-    return ExamStartResponse(attempt_id=attempt.id, exam=exam, questions=question_out)
+    paper = await db.run_sync(get_paper, exam)
+    return Response(
+        content=render_start_response(attempt.id, paper, saved_answers(attempt)),
+        media_type="application/json",
+    )
 
 
-@router.post("/{exam_id}/submit", response_model=ExamSubmitResponse, dependencies=[Depends(get_current_student)])
-def submit_exam(
+@router.post("/{exam_id}/autosave", dependencies=[Depends(get_current_student)])
+def autosave_answers(
     exam_id: int,
-    payload: ExamSubmitRequest,
+    payload: ExamAutosaveRequest,
     db: Session = Depends(get_db),
     student=Depends(get_current_student),
 ):
@@ -296,57 +333,64 @@ def submit_exam(
     )
     if not attempt or attempt.student_id != student.id:
         raise HTTPException(status_code=404, detail="Attempt not found")
-    if attempt.status == "submitted":
+    if attempt.status != "in_progress":
         raise HTTPException(status_code=400, detail="Exam already submitted")
 
-    exam = db.query(Exam).filter(Exam.id == exam_id).first()
-    if not exam:
-        raise HTTPException(status_code=404, detail="Exam not found")
+    buffer_answers(attempt.id, {ans.question_id: ans.option_id for ans in payload.answers})
+    return {"status": "queued", "saved": len(payload.answers)}
 
-    answers_map = {ans.question_id: ans.option_id for ans in payload.answers}
-    total_score = 0.0
 
-    questions = db.query(ExamQuestion).filter(ExamQuestion.exam_id == exam_id).all()
-    for question in questions:
-        selected_option_id = answers_map.get(question.id)
-        if not selected_option_id:
-            continue
+@router.post("/{exam_id}/submit", response_model=ExamSubmitResponse, dependencies=[Depends(get_current_student)])
+async def submit_exam(
+    exam_id: int,
+    payload: ExamSubmitRequest,
+    db: AsyncSession = Depends(get_async_db),
+    student=Depends(get_current_student),
+):
+    attempt = await db.scalar(
+        select(ExamAttempt).where(ExamAttempt.id == payload.attempt_id, ExamAttempt.exam_id == exam_id)
+    )
+    if not attempt or attempt.student_id != student.id:
+        raise HTTPException(status_code=404, detail="Attempt not found")
+    if attempt.status == "submitted":
+        raise HTTPException(status_code=400, detail="Exam already submitted")
 
-        option = (
-            db.query(ExamOption)
-            .filter(ExamOption.id == selected_option_id, ExamOption.question_id == question.id)
-            .first()
-        )
-        if not option:
-            continue
-
-        is_correct = option.is_correct
-        marks = float(question.marks) if question.marks is not None else 1.0
-        negative_value = 0.0
-        if exam.negative_marking_enabled:
-            if question.negative_marks is not None:
-                negative_value = float(question.negative_marks)
-            elif exam.negative_mark_value is not None:
-                negative_value = float(exam.negative_mark_value)
-
-        marks_awarded = marks if is_correct else -negative_value
-        total_score += marks_awarded
-
-        answer = ExamAnswer(
-            attempt_id=attempt.id,
-            question_id=question.id,
-            option_id=option.id,
-            is_correct=is_correct,
-            marks_awarded=marks_awarded,
-        )
-        db.add(answer)
+    exam = await db.get(Exam, exam_id)
+    if not exam:
+        raise HTTPException(status_code=404, detail="Exam not found")
+    if attempt.started_at and datetime.utcnow() > attempt_deadline(exam, attempt.started_at):
+        # Too late for fresh answers; the expiry sweeper submits the saved draft.
+        raise HTTPException(status_code=400, detail="Exam time is over")
+
+    # Claim the attempt the way the expiry sweeper does, so a submit racing the
+    # sweeper (or a double submit) grades it exactly once.
+    claimed = await db.execute(
+        update(ExamAttempt)
+        .where(ExamAttempt.id == attempt.id, ExamAttempt.status == "in_progress")
+        .values(status="submitted", submitted_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount == 0:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Exam already submitted")
 
-    attempt.status = "submitted"
-    attempt.submitted_at = datetime.utcnow()
-    attempt.total_score = total_score
-    db.commit()
+    # Re-read the draft after the claim: a flush that committed since the attempt was loaded is included.
+    raw_draft = await db.scalar(select(ExamAttempt.draft_answers).where(ExamAttempt.id == attempt.id))
+    answers_map = take_answers(attempt.id, raw_draft)
+    answers_map.update({ans.question_id: ans.option_id for ans in payload.answers})
+    answer_key = await db.run_sync(get_answer_key, exam)
+    total_score, answer_rows = answer_key.grade(attempt.id, answers_map)
+    await db.run_sync(save_answers, answer_rows)
+
+    await db.execute(
+        update(ExamAttempt)
+        .where(ExamAttempt.id == attempt.id)
+        .values(total_score=total_score, draft_answers=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
 
-    return ExamSubmitResponse(attempt_id=attempt.id, total_score=total_score, status=attempt.status)
+    return ExamSubmitResponse(attempt_id=attempt.id, total_score=total_score, status="submitted")
 
 
 @router.get("/student/attempts", response_model=list[ExamAttemptOut], dependencies=[Depends(get_current_student)])
@@ -1,16 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.api.conditional import collection_etag
 from app.api.deps import get_current_user, get_db
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import PageParams, paginate
 from app.models.expense import Expense
 from app.schemas.expense import ExpenseCreate, ExpenseOut, ExpenseUpdate
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
 
-@router.get("/", response_model=list[ExpenseOut])
-def list_expenses(db: Session = Depends(get_db)):
-    return db.query(Expense).order_by(Expense.id.desc()).all()
+@router.get("/", response_model=list[ExpenseOut], dependencies=[collection_etag(Expense)])
+def list_expenses(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Expense), Expense, ExpenseOut, page, response)
+
+
+@router.get("/export")
+def export_expenses(
+    format: str = ExportFormat,
+    paid_from: date | None = None,
+    paid_to: date | None = None,
+):
+    def build_query(db: Session):
+        query = db.query(Expense)
+        if paid_from:
+            query = query.filter(Expense.paid_on >= paid_from)
+        if paid_to:
+            query = query.filter(Expense.paid_on <= paid_to)
+        return query
+
+    return export_response(build_query, Expense, ExpenseOut, format, "expenses")
 
 
 @router.post("/", response_model=ExpenseOut)
@@ -1,16 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
+from app.api.conditional import collection_etag
 from app.api.deps import get_current_user, get_db
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import PageParams, paginate
 from app.models.fee import Fee
 from app.schemas.fee import FeeCreate, FeeOut, FeeUpdate
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
 
-@router.get("/", response_model=list[FeeOut])
-def list_fees(db: Session = Depends(get_db)):
-    return db.query(Fee).order_by(Fee.id.desc()).all()
+@router.get("/", response_model=list[FeeOut], dependencies=[collection_etag(Fee)])
+def list_fees(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Fee), Fee, FeeOut, page, response)
+
+
+@router.get("/export")
+def export_fees(
+    format: str = ExportFormat,
+    paid_from: date | None = None,
+    paid_to: date | None = None,
+):
+    def build_query(db: Session):
+        query = db.query(Fee)
+        if paid_from:
+            query = query.filter(Fee.paid_on >= paid_from)
+        if paid_to:
+            query = query.filter(Fee.paid_on <= paid_to)
+        return query
+
+    return export_response(build_query, Fee, FeeOut, format, "fees")
 
 
 @router.post("/", response_model=FeeOut)
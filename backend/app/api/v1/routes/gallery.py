@@ -1,13 +1,17 @@
 from pathlib import Path
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Request, Response, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_async_read_db, get_current_user, get_db
+from app.api.pagination import NEXT_CURSOR_HEADER, PageParams, paginate
+from app.api.response_cache import cached_response_async, invalidate, json_response
 from app.core.config import settings
 from app.models.gallery import Gallery
 from app.schemas.gallery import GalleryCreate, GalleryOut, GalleryUpdate
+from app.services.gallery_variants import build_gallery_variants, variant_paths
 
 router = APIRouter()
 
@@ -50,11 +54,29 @@ def _save_upload_file(file: UploadFile, file_path: Path) -> None:
 
 
 @router.get("/", response_model=list[GalleryOut])
-def list_gallery(active_only: bool = True, db: Session = Depends(get_db)):
-    query = db.query(Gallery)
-    if active_only:
-        query = query.filter(Gallery.is_active.is_(True))
-    return query.order_by(Gallery.id.desc()).all()
+async def list_gallery(
+    request: Request,
+    active_only: bool = True,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    def render(session: Session):
+        query = session.query(Gallery)
+        if active_only:
+            query = query.filter(Gallery.is_active.is_(True))
+        page_headers = Response()
+        rows = paginate(query, Gallery, GalleryOut, page, page_headers)
+        if isinstance(rows, Response):
+            return rows
+        response = json_response(rows, GalleryOut)
+        if NEXT_CURSOR_HEADER in page_headers.headers:
+            response.headers[NEXT_CURSOR_HEADER] = page_headers.headers[NEXT_CURSOR_HEADER]
+        return response
+
+    async def render_async():
+        return await db.run_sync(render)
+
+    return await cached_response_async(request, "gallery", render_async)
 
 
 @router.post("/", response_model=GalleryOut, dependencies=[Depends(get_current_user)])
@@ -62,12 +84,14 @@ def create_gallery_item(payload: GalleryCreate, db: Session = Depends(get_db)):
     item = Gallery(**payload.dict())
     db.add(item)
     db.commit()
+    invalidate("gallery")
     db.refresh(item)
     return item
 
 
 @router.post("/upload", response_model=GalleryOut, dependencies=[Depends(get_current_user)])
 def upload_gallery_item(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     title: str | None = Form(None),
     media_type: str | None = Form(None),
@@ -104,21 +128,42 @@ def upload_gallery_item(
     )
     db.add(item)
     db.commit()
+    invalidate("gallery")
     db.refresh(item)
+    if item.media_type == "photo":
+        background_tasks.add_task(build_gallery_variants, item.id, UPLOAD_DIR, item.url)
     return item
 
 
 @router.put("/{item_id}", response_model=GalleryOut, dependencies=[Depends(get_current_user)])
-def update_gallery_item(item_id: int, payload: GalleryUpdate, db: Session = Depends(get_db)):
+def update_gallery_item(
+    item_id: int,
+    payload: GalleryUpdate,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     item = db.query(Gallery).filter(Gallery.id == item_id).first()
     if not item:
         raise HTTPException(status_code=404, detail="Gallery item not found")
 
-    for key, value in payload.dict(exclude_unset=True).items():
+    data = payload.dict(exclude_unset=True)
+    old_url = item.url
+    url_changed = "url" in data and data["url"] != old_url
+    if url_changed:
+        item.srcset = None
+        item.placeholder = None
+    for key, value in data.items():
         setattr(item, key, value)
 
     db.commit()
+    invalidate("gallery")
     db.refresh(item)
+    if url_changed:
+        if old_url and old_url.startswith("/uploads/"):
+            for variant in variant_paths(UPLOAD_DIR, old_url):
+                variant.unlink(missing_ok=True)
+        if item.media_type == "photo" and item.url and item.url.startswith("/uploads/"):
+            background_tasks.add_task(build_gallery_variants, item.id, UPLOAD_DIR, item.url)
     return item
 
 
@@ -132,7 +177,10 @@ def delete_gallery_item(item_id: int, db: Session = Depends(get_db)):
         file_path = UPLOAD_DIR / Path(item.url).name
         if file_path.exists():
             file_path.unlink()
+        for variant in variant_paths(UPLOAD_DIR, item.url):
+            variant.unlink()
 
     db.delete(item)
     db.commit()
+    invalidate("gallery")
     return {"status": "deleted"}
@@ -1,11 +1,16 @@
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    verify_and_update_password_async,
+)
 from app.models.student import Student
 from app.schemas.student_auth import StudentLoginRequest, StudentRegisterRequest, StudentToken
 
@@ -13,9 +18,9 @@ router = APIRouter()
 
 
 @router.post("/register", response_model=StudentToken)
-def register_student(payload: StudentRegisterRequest, db: Session = Depends(get_db)):
-    student = (
-        db.query(Student)
+async def register_student(payload: StudentRegisterRequest, db: Session = Depends(get_db)):
+    student = await run_in_threadpool(
+        lambda: db.query(Student)
         .filter(Student.enrollment_no == payload.enrollment_no, Student.dob == payload.dob)
         .first()
     )
@@ -24,23 +29,37 @@ def register_student(payload: StudentRegisterRequest, db: Session = Depends(get_
     if student.login_enabled:
         raise HTTPException(status_code=400, detail="Login already enabled")
 
-    student.login_password_hash = get_password_hash(payload.password)
+    student.login_password_hash = await get_password_hash_async(payload.password, account="student")
     student.login_enabled = True
-    db.commit()
+    student_id = student.id
+    await run_in_threadpool(db.commit)
 
     token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = create_access_token(subject=f"student:{student.id}", expires_delta=token_expires)
+    token = create_access_token(subject=f"student:{student_id}", expires_delta=token_expires)
     return StudentToken(access_token=token)
 
 
 @router.post("/login", response_model=StudentToken)
-def login_student(payload: StudentLoginRequest, db: Session = Depends(get_db)):
-    student = db.query(Student).filter(Student.enrollment_no == payload.enrollment_no).first()
+async def login_student(payload: StudentLoginRequest, db: Session = Depends(get_db)):
+    student = await run_in_threadpool(
+        lambda: db.query(Student).filter(Student.enrollment_no == payload.enrollment_no).first()
+    )
     if not student or not student.login_enabled:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Login not enabled")
-    if not student.login_password_hash or not verify_password(payload.password, student.login_password_hash):
+    if not student.login_password_hash:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    valid, new_hash = await verify_and_update_password_async(
+        payload.password, student.login_password_hash, account="student"
+    )
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    # Read the id before committing: the commit expires the instance and a
+    # later attribute access would reload it synchronously on the event loop.
+    student_id = student.id
+    if new_hash:
+        student.login_password_hash = new_hash
+        await run_in_threadpool(db.commit)
 
     token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = create_access_token(subject=f"student:{student.id}", expires_delta=token_expires)
+    token = create_access_token(subject=f"student:{student_id}", expires_delta=token_expires)
     return StudentToken(access_token=token)
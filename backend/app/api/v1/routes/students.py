@@ -3,14 +3,19 @@ from pathlib import Path
 from random import randint
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
+from app.api.conditional import collection_etag
 from app.api.deps import get_current_user, get_db
+from app.api.export import ExportFormat, export_response
+from app.api.pagination import PageParams, paginate
 from app.core.config import settings
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
 from app.models.student import Student
 from app.schemas.student import StudentCreate, StudentOut, StudentUpdate
+from app.services.images import InvalidImage, parse_formats, resize_image_async
 
 router = APIRouter(dependencies=[Depends(get_current_user)])
 
@@ -19,43 +24,52 @@ IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
 MAX_UPLOAD_BYTES = settings.MEDIA_MAX_SIZE_MB * 1024 * 1024
 
 
-def _save_upload_file(file: UploadFile, file_path: Path) -> None:
-    size = 0
-    with file_path.open("wb") as buffer:
-        while True:
-            chunk = file.file.read(1024 * 1024)
-            if not chunk:
-                break
-            size += len(chunk)
-            if size > MAX_UPLOAD_BYTES:
-                buffer.close()
-                if file_path.exists():
-                    file_path.unlink()
-                raise HTTPException(status_code=400, detail="File too large")
-            buffer.write(chunk)
-
-
-def _save_student_photo(file: UploadFile) -> str:
+async def _save_student_photo(file: UploadFile) -> str:
     if not file.filename:
         raise HTTPException(status_code=400, detail="Photo is required")
     suffix = Path(file.filename).suffix.lower()
     if suffix not in IMAGE_EXTS and not (file.content_type or "").startswith("image/"):
         raise HTTPException(status_code=400, detail="Invalid photo type")
-    if not suffix:
-        suffix = ".jpg"
+
+    data = await file.read(MAX_UPLOAD_BYTES + 1)
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=400, detail="File too large")
+    try:
+        photo = await resize_image_async(
+            data,
+            settings.STUDENT_PHOTO_MAX_DIMENSION,
+            parse_formats(settings.STUDENT_PHOTO_FORMATS),
+            settings.IMAGE_QUALITY,
+        )
+    except InvalidImage:
+        raise HTTPException(status_code=400, detail="Invalid photo type")
+
     UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    filename = f"{uuid4().hex}{suffix}"
-    file_path = UPLOAD_DIR / filename
-    _save_upload_file(file, file_path)
+    filename = f"{uuid4().hex}{photo.extension}"
+    await run_in_threadpool((UPLOAD_DIR / filename).write_bytes, photo.data)
     return f"/uploads/students/{filename}"
 
 
+def _remove_student_photo(photo_url: str | None) -> None:
+    if photo_url and photo_url.startswith("/uploads/students/"):
+        existing = UPLOAD_DIR / Path(photo_url).name
+        if existing.exists():
+            existing.unlink()
+
+
 def _parse_date(value: str | None) -> date | None:
     if not value:
         return None
     return date.fromisoformat(value)
 
 
+def _commit_student(db: Session, student: Student) -> Student:
+    db.add(student)
+    db.commit()
+    db.refresh(student)
+    return student
+
+
 def _generate_enrollment_no(db: Session) -> str:
     date_part = datetime.utcnow().strftime("%Y%m%d")
     for _ in range(10):
@@ -67,12 +81,17 @@ def _generate_enrollment_no(db: Session) -> str:
     raise HTTPException(status_code=500, detail="Unable to generate enrollment number")
 
 
-@router.get("/", response_model=list[StudentOut])
-def list_students(db: Session = Depends(get_db)):
-    return db.query(Student).order_by(Student.id.desc()).all()
+@router.get("/", response_model=list[StudentOut], dependencies=[collection_etag(Student)])
+def list_students(response: Response, page: PageParams = Depends(), db: Session = Depends(get_db)):
+    return paginate(db.query(Student), Student, StudentOut, page, response)
 
 
-@router.get("/{student_id}", response_model=StudentOut)
+@router.get("/export")
+def export_students(format: str = ExportFormat):
+    return export_response(lambda db: db.query(Student), Student, StudentOut, format, "students")
+
+
+@router.get("/{student_id}", response_model=StudentOut, dependencies=[collection_etag(Student)])
 def get_student(student_id: int, db: Session = Depends(get_db)):
     student = db.query(Student).filter(Student.id == student_id).first()
     if not student:
@@ -99,7 +118,7 @@ def create_student(payload: StudentCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/upload", response_model=StudentOut)
-def create_student_with_photo(
+async def create_student_with_photo(
     photo: UploadFile = File(...),
     enrollment_no: str | None = Form(None),
     name: str = Form(...),
@@ -119,12 +138,14 @@ def create_student_with_photo(
         raise HTTPException(status_code=400, detail="DOB is required")
     enrollment_no = (enrollment_no or "").strip() or None
     if enrollment_no:
-        existing = db.query(Student).filter(Student.enrollment_no == enrollment_no).first()
+        existing = await run_in_threadpool(
+            lambda: db.query(Student).filter(Student.enrollment_no == enrollment_no).first()
+        )
         if existing:
             raise HTTPException(status_code=400, detail="Enrollment number already exists")
     else:
-        enrollment_no = _generate_enrollment_no(db)
-    photo_url = _save_student_photo(photo)
+        enrollment_no = await run_in_threadpool(_generate_enrollment_no, db)
+    photo_url = await _save_student_photo(photo)
     student = Student(
         enrollment_no=enrollment_no,
         name=name,
@@ -138,10 +159,7 @@ def create_student_with_photo(
         status=status,
         photo_url=photo_url,
     )
-    db.add(student)
-    db.commit()
-    db.refresh(student)
-    return student
+    return await run_in_threadpool(_commit_student, db, student)
 
 
 @router.put("/{student_id}", response_model=StudentOut)
@@ -159,39 +177,35 @@ def update_student(student_id: int, payload: StudentUpdate, db: Session = Depend
 
 
 @router.post("/{student_id}/photo", response_model=StudentOut)
-def update_student_photo(
+async def update_student_photo(
     student_id: int,
     photo: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
-    student = db.query(Student).filter(Student.id == student_id).first()
+    student = await run_in_threadpool(lambda: db.query(Student).filter(Student.id == student_id).first())
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    if student.photo_url and student.photo_url.startswith("/uploads/students/"):
-        existing = UPLOAD_DIR / Path(student.photo_url).name
-        if existing.exists():
-            existing.unlink()
-
-    student.photo_url = _save_student_photo(photo)
-    db.commit()
-    db.refresh(student)
+    previous_url = student.photo_url
+    student.photo_url = await _save_student_photo(photo)
+    student = await run_in_threadpool(_commit_student, db, student)
+    await run_in_threadpool(_remove_student_photo, previous_url)
     return student
 
 
 @router.post("/{student_id}/set-password")
-def set_student_password(
+async def set_student_password(
     student_id: int,
     password: str = Form(...),
     db: Session = Depends(get_db),
 ):
-    student = db.query(Student).filter(Student.id == student_id).first()
+    student = await run_in_threadpool(lambda: db.query(Student).filter(Student.id == student_id).first())
     if not student:
         raise HTTPException(status_code=404, detail="Student not found")
 
-    student.login_password_hash = get_password_hash(password)
+    student.login_password_hash = await get_password_hash_async(password, account="student")
     student.login_enabled = True
-    db.commit()
+    await run_in_threadpool(db.commit)
     return {"status": "updated"}
 
 
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.conditional import collection_etag
+from app.api.deps import get_async_db, get_current_user, get_db
+from app.api.response_cache import cached_response_async, invalidate, json_response
 from app.models.trade import Trade
 from app.schemas.trade import TradeCreate, TradeOut, TradeUpdate
 
@@ -9,14 +13,18 @@ router = APIRouter()
 
 
 @router.get("/", response_model=list[TradeOut])
-def list_trades(active_only: bool = True, db: Session = Depends(get_db)):
-    query = db.query(Trade)
-    if active_only:
-        query = query.filter(Trade.is_active.is_(True))
-    return query.order_by(Trade.id.desc()).all()
+async def list_trades(request: Request, active_only: bool = True, db: AsyncSession = Depends(get_async_db)):
+    async def render():
+        query = select(Trade)
+        if active_only:
+            query = query.where(Trade.is_active.is_(True))
+        trades = (await db.scalars(query.order_by(Trade.id.desc()))).all()
+        return json_response(trades, TradeOut)
 
+    return await cached_response_async(request, "trades", render)
 
-@router.get("/{trade_id}", response_model=TradeOut)
+
+@router.get("/{trade_id}", response_model=TradeOut, dependencies=[collection_etag(Trade)])
 def get_trade(trade_id: int, db: Session = Depends(get_db)):
     trade = db.query(Trade).filter(Trade.id == trade_id).first()
     if not trade:
@@ -32,6 +40,7 @@ def create_trade(payload: TradeCreate, db: Session = Depends(get_db)):
     trade = Trade(**payload.dict())
     db.add(trade)
     db.commit()
+    invalidate("trades")
     db.refresh(trade)
     return trade
 
@@ -46,6 +55,7 @@ def update_trade(trade_id: int, payload: TradeUpdate, db: Session = Depends(get_
         setattr(trade, key, value)
 
     db.commit()
+    invalidate("trades")
     db.refresh(trade)
     return trade
 
@@ -58,4 +68,5 @@ def delete_trade(trade_id: int, db: Session = Depends(get_db)):
 
     db.delete(trade)
     db.commit()
+    invalidate("trades")
     return {"status": "deleted"}
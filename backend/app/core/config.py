@@ -8,8 +8,46 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 12
     ALGORITHM: str = "HS256"
     SQLALCHEMY_DATABASE_URI: str = "sqlite:///./pragati.db"
+    ASYNC_DATABASE_URI: str | None = None
+    SQLALCHEMY_REPLICA_URIS: str = ""
+    REPLICA_STICKY_SECONDS: float = 5
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: float = 30
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 20000
+    SQLITE_MMAP_SIZE_BYTES: int = 256 * 1024 * 1024
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:5174,http://127.0.0.1:5173,http://127.0.0.1:5174"
     MEDIA_MAX_SIZE_MB: int = 25
+    IMAGE_WORKERS: int = 2
+    IMAGE_QUALITY: int = 80
+    STUDENT_PHOTO_MAX_DIMENSION: int = 600
+    STUDENT_PHOTO_FORMATS: str = "WEBP,JPEG"
+    GALLERY_VARIANT_WIDTHS: str = "320,640,1280"
+    GALLERY_VARIANT_FORMATS: str = "WEBP,JPEG"
+    PAGE_SIZE_DEFAULT: int = 100
+    PAGE_SIZE_MAX: int = 500
+    CATALOG_CACHE_TTL_SECONDS: int = 60
+    CATALOG_CACHE_SIZE: int = 256
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_SIZE: int = 4096
+    TOKEN_CACHE_SIZE: int = 4096
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 200
+    BCRYPT_ROUNDS_STAFF: int = 12
+    BCRYPT_ROUNDS_STUDENT: int = 10
+    EXAM_PAPER_CACHE_SIZE: int = 64
+    ANSWER_KEY_CACHE_SIZE: int = 128
+    REGRADE_CHUNK_SIZE: int = 500
+    REGRADE_STALE_SECONDS: float = 600
+    AUTOSAVE_FLUSH_INTERVAL_SECONDS: float = 5
+    AUTOSAVE_MAX_PENDING: int = 5000
+    EXAM_SWEEP_INTERVAL_SECONDS: float = 30
+    EXAM_SWEEP_BATCH_SIZE: int = 200
+    DASHBOARD_RECONCILE_INTERVAL_SECONDS: float = 3600
 
     class Config:
         env_file = ".env"
@@ -1,23 +1,154 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
-
-from jose import jwt
-from passlib.context import CryptContext
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from app.core.cache import LRUCache
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+# python-jose and passlib are imported on first use: they dominate import time
+# and a worker can answer health checks long before anyone logs in.
+
+
+def _bcrypt_context(rounds: int) -> "CryptContext":
+    from passlib.context import CryptContext
+
+    # Pinning min/max to the default makes needs_update() flag any hash with a
+    # different cost, so logins move stored hashes both up and down.
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+ACCOUNT_ROUNDS = {
+    "staff": settings.BCRYPT_ROUNDS_STAFF,
+    "student": settings.BCRYPT_ROUNDS_STUDENT,
+}
+pwd_contexts: dict[str, "CryptContext"] = {}
+_pwd_contexts_lock = threading.Lock()
+
+
+def password_context(account: str) -> "CryptContext":
+    context = pwd_contexts.get(account)
+    if context is None:
+        with _pwd_contexts_lock:
+            context = pwd_contexts.get(account)
+            if context is None:
+                context = pwd_contexts[account] = _bcrypt_context(ACCOUNT_ROUNDS[account])
+    return context
+
+
+_decoded_tokens = LRUCache(maxsize=settings.TOKEN_CACHE_SIZE)
+
+# bcrypt releases the GIL, so a small dedicated thread pool keeps password work
+# off both the event loop and the threadpool that serves sync routes.
+_password_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+_password_stats = {"queued": 0, "running": 0, "completed": 0, "rejected": 0}
+_password_stats_lock = threading.Lock()
+
+
+class PasswordHashingBusy(RuntimeError):
+    pass
+
+
+class InvalidToken(ValueError):
+    pass
+
+
+def verify_password(plain_password: str, hashed_password: str, account: str = "staff") -> bool:
+    return password_context(account).verify(plain_password, hashed_password)
+
 
+def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+    account: str = "staff",
+) -> tuple[bool, Optional[str]]:
+    """Verify a password and return a rehash when the stored cost is out of date."""
+    return password_context(account).verify_and_update(plain_password, hashed_password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
 
+def get_password_hash(password: str, account: str = "staff") -> str:
+    return password_context(account).hash(password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+
+def benchmark_password_hash(rounds: int, samples: int = 3) -> float:
+    """Median wall time in milliseconds of one bcrypt hash at ``rounds`` on this host."""
+    context = _bcrypt_context(rounds)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        context.hash("benchmark-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def password_pool_stats() -> dict:
+    with _password_stats_lock:
+        return {
+            **_password_stats,
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_queue": settings.PASSWORD_HASH_MAX_QUEUE,
+        }
+
+
+def _run_tracked(func: Callable, *args):
+    with _password_stats_lock:
+        _password_stats["queued"] -= 1
+        _password_stats["running"] += 1
+    try:
+        return func(*args)
+    finally:
+        with _password_stats_lock:
+            _password_stats["running"] -= 1
+            _password_stats["completed"] += 1
+
+
+async def _submit(func: Callable, *args):
+    with _password_stats_lock:
+        if _password_stats["queued"] >= settings.PASSWORD_HASH_MAX_QUEUE:
+            _password_stats["rejected"] += 1
+            raise PasswordHashingBusy("Password hashing queue is full")
+        _password_stats["queued"] += 1
+    return await asyncio.wrap_future(_password_pool.submit(_run_tracked, func, *args))
+
+
+async def verify_password_async(plain_password: str, hashed_password: str, account: str = "staff") -> bool:
+    return await _submit(verify_password, plain_password, hashed_password, account)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str,
+    account: str = "staff",
+) -> tuple[bool, Optional[str]]:
+    return await _submit(verify_and_update_password, plain_password, hashed_password, account)
+
+
+async def get_password_hash_async(password: str, account: str = "staff") -> str:
+    return await _submit(get_password_hash, password, account)
+
+
+async def benchmark_password_hash_async(rounds: int) -> float:
+    return await _submit(benchmark_password_hash, rounds)
 
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
+    from jose import jwt
+
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -27,4 +158,15 @@ def create_access_token(subject: str, expires_delta: Optional[timedelta] = None)
 
 
 def decode_access_token(token: str) -> dict:
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    payload = _decoded_tokens.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    from jose import JWTError, jwt
+
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError as exc:
+        raise InvalidToken(str(exc)) from exc
+    _decoded_tokens.set(token, payload)
+    return payload
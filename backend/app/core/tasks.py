@@ -0,0 +1,49 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Run ``func`` every ``interval`` seconds on a daemon thread.
+
+    ``trigger()`` wakes the thread early, e.g. when a buffer fills up. Runs never
+    overlap, so a slow pass simply delays the next one.
+    """
+
+    def __init__(self, name: str, interval: float, func: Callable[[], None]) -> None:
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def trigger(self) -> None:
+        self._wake.set()
+
+    def stop(self, timeout: float | None = 10) -> None:
+        self._stopping.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self.func()
+            except Exception:
+                logger.exception("Periodic task %s failed", self.name)
@@ -1,25 +1,73 @@
+import hashlib
+
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
 from app import models  # noqa: F401
 from app.db.base import Base
+from app.db.migrate import LATEST_VERSION, migrate
 from app.db.session import SessionLocal, engine
+from app.models.schema_state import SchemaState
 from app.models.trade import Trade
+from app.services.rollups import ensure_rollups
+
+DEFAULT_TRADES = (
+    ("Technical", "Technical trade courses"),
+    ("Computer", "Computer-related courses"),
+)
+STATE_NAME = "app"
+
+
+def _schema_fingerprint() -> str:
+    parts = [f"migrations:{LATEST_VERSION}", f"trades:{DEFAULT_TRADES!r}"]
+    for table in sorted(Base.metadata.tables.values(), key=lambda t: t.name):
+        columns = ",".join(f"{col.name} {col.type} {col.nullable}" for col in table.columns)
+        indexes = ",".join(
+            sorted(f"{index.name}({','.join(col.name for col in index.columns)})" for index in table.indexes)
+        )
+        parts.append(f"{table.name}[{columns}][{indexes}]")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+SCHEMA_FINGERPRINT = _schema_fingerprint()
+
+
+def _stored_fingerprint() -> str | None:
+    try:
+        with engine.connect() as conn:
+            return conn.execute(
+                select(SchemaState.fingerprint).where(SchemaState.name == STATE_NAME)
+            ).scalar()
+    except (OperationalError, ProgrammingError):
+        return None
 
 
 def _seed_trades() -> None:
-    defaults = [
-        ("Technical", "Technical trade courses"),
-        ("Computer", "Computer-related courses"),
-    ]
     db = SessionLocal()
     try:
-        for name, description in defaults:
-            exists = db.query(Trade).filter(Trade.name == name).first()
-            if not exists:
+        names = [name for name, _ in DEFAULT_TRADES]
+        existing = {name for (name,) in db.query(Trade.name).filter(Trade.name.in_(names))}
+        for name, description in DEFAULT_TRADES:
+            if name not in existing:
                 db.add(Trade(name=name, description=description, is_active=True))
+        state = db.get(SchemaState, STATE_NAME)
+        if state is None:
+            db.add(SchemaState(name=STATE_NAME, fingerprint=SCHEMA_FINGERPRINT))
+        else:
+            state.fingerprint = SCHEMA_FINGERPRINT
         db.commit()
     finally:
         db.close()
 
 
-def init_db() -> None:
-    Base.metadata.create_all(bind=engine)
+def init_db() -> bool:
+    """Migrate, seed and backfill unless the stored fingerprint shows that already happened.
+
+    Returns True when the full initialisation ran.
+    """
+    if _stored_fingerprint() == SCHEMA_FINGERPRINT:
+        return False
+    migrate()
+    ensure_rollups()
     _seed_trades()
+    return True
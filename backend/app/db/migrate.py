@@ -1,48 +1,121 @@
-from sqlalchemy import inspect, text
+import logging
+from typing import Callable
+
+from sqlalchemy import Column, Index, MetaData, Table, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.sql import func
 
 from app.db.base import Base
 from app.db.session import engine
 from app import models  # noqa: F401
+from app.models.exam import RegradeJob
+from app.models.schema_migration import SchemaMigration
+
+logger = logging.getLogger(__name__)
+
+
+def _add_columns(conn: Connection, table_name: str, column_defs: dict[str, str]) -> None:
+    existing = {col["name"] for col in inspect(conn).get_columns(table_name)}
+    for name, column_def in column_defs.items():
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {name} {column_def}"))
+
+
+def _create_index(conn: Connection, name: str, table_name: str, columns: str) -> None:
+    # Inspected rather than IF NOT EXISTS, which MySQL does not accept for indexes.
+    if name in {index["name"] for index in inspect(conn).get_indexes(table_name)}:
+        return
+    names = [column.strip() for column in columns.split(",")]
+    table = Table(table_name, MetaData(), *(Column(column) for column in names))
+    Index(name, *(table.c[column] for column in names)).create(conn)
+
+
+def _course_trade(conn: Connection) -> None:
+    _add_columns(conn, "courses", {"trade_id": "INTEGER"})
+
+
+def _student_profile(conn: Connection) -> None:
+    _add_columns(
+        conn,
+        "students",
+        {
+            "enrollment_no": "VARCHAR(50)",
+            "father_name": "VARCHAR(120)",
+            "dob": "DATE",
+            "photo_url": "VARCHAR(255)",
+            "login_password_hash": "VARCHAR(255)",
+            "login_enabled": "BOOLEAN DEFAULT 0",
+        },
+    )
+
+
+def _certificate_grades(conn: Connection) -> None:
+    _add_columns(conn, "certificates", {"grade": "VARCHAR(50)", "percentage": "NUMERIC(6, 2)"})
 
 
-def _table_columns(table_name: str) -> list[str]:
-    inspector = inspect(engine)
-    if table_name not in inspector.get_table_names():
-        return []
-    return [col["name"] for col in inspector.get_columns(table_name)]
+def _exam_content_version(conn: Connection) -> None:
+    _add_columns(conn, "exams", {"content_version": "INTEGER DEFAULT 1"})
 
 
-def _add_column(table_name: str, column_def: str) -> None:
-    with engine.begin() as conn:
-        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_def}"))
+def _exam_attempt_drafts(conn: Connection) -> None:
+    _add_columns(conn, "exam_attempts", {"draft_answers": "TEXT"})
+    _create_index(conn, "ix_exam_attempts_status_exam_started", "exam_attempts", "status, exam_id, started_at")
+
+
+def _hot_path_indexes(conn: Connection) -> None:
+    _create_index(conn, "ix_exam_answers_attempt_question", "exam_answers", "attempt_id, question_id")
+    _create_index(conn, "ix_exam_attempts_exam_student", "exam_attempts", "exam_id, student_id")
+    _create_index(conn, "ix_fees_student_paid_on", "fees", "student_id, paid_on")
+    _create_index(conn, "ix_certificates_student_id", "certificates", "student_id")
+
+
+def _gallery_variants(conn: Connection) -> None:
+    _add_columns(conn, "gallery", {"srcset": "JSON", "placeholder": "TEXT"})
+
+
+def _regrade_jobs(conn: Connection) -> None:
+    RegradeJob.__table__.create(conn, checkfirst=True)
+
+
+# Append only: a step's version is recorded once it has been applied, so
+# existing entries must never be reordered or edited.
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "course trade", _course_trade),
+    (2, "student profile and login", _student_profile),
+    (3, "certificate grades", _certificate_grades),
+    (4, "exam content version", _exam_content_version),
+    (5, "exam attempt drafts", _exam_attempt_drafts),
+    (6, "hot path indexes", _hot_path_indexes),
+    (7, "gallery variants", _gallery_variants),
+    (8, "regrade jobs", _regrade_jobs),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def current_version() -> int | None:
+    """Applied schema version, or None when the version table does not exist yet."""
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(SchemaMigration.version))).scalar() or 0
+    except (OperationalError, ProgrammingError):
+        return None
 
 
 def migrate() -> None:
-    Base.metadata.create_all(bind=engine)
+    version = current_version()
+    if version == LATEST_VERSION:
+        return
 
-    course_cols = _table_columns("courses")
-    if "trade_id" not in course_cols:
-        _add_column("courses", "trade_id INTEGER")
-
-    student_cols = _table_columns("students")
-    if "enrollment_no" not in student_cols:
-        _add_column("students", "enrollment_no VARCHAR(50)")
-    if "father_name" not in student_cols:
-        _add_column("students", "father_name VARCHAR(120)")
-    if "dob" not in student_cols:
-        _add_column("students", "dob DATE")
-    if "photo_url" not in student_cols:
-        _add_column("students", "photo_url VARCHAR(255)")
-    if "login_password_hash" not in student_cols:
-        _add_column("students", "login_password_hash VARCHAR(255)")
-    if "login_enabled" not in student_cols:
-        _add_column("students", "login_enabled BOOLEAN DEFAULT 0")
-
-    certificate_cols = _table_columns("certificates")
-    if "grade" not in certificate_cols:
-        _add_column("certificates", "grade VARCHAR(50)")
-    if "percentage" not in certificate_cols:
-        _add_column("certificates", "percentage NUMERIC(6, 2)")
+    Base.metadata.create_all(bind=engine)
+    version = version or 0
+    for step_version, name, step in MIGRATIONS:
+        if step_version <= version:
+            continue
+        with engine.begin() as conn:
+            step(conn)
+            conn.execute(SchemaMigration.__table__.insert().values(version=step_version, name=name))
+        logger.info("Applied schema migration %s: %s", step_version, name)
 
 
 if __name__ == "__main__":
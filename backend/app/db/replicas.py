@@ -0,0 +1,74 @@
+import itertools
+import threading
+import time
+
+from fastapi import Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, async_database_uri, configure_engine, pool_args
+
+PRIMARY_HEADER = "X-Read-Primary"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+replica_engines: list[AsyncEngine] = []
+_replica_sessions: list[async_sessionmaker] = []
+_next_replica = itertools.cycle(_replica_sessions)
+_lock = threading.Lock()
+
+
+def configure_replicas(uris: list[str]) -> list[AsyncEngine]:
+    """Replace the replica pool; returns the engines that were dropped so callers can dispose them."""
+    global _next_replica
+    engines = []
+    for uri in uris:
+        replica = create_async_engine(async_database_uri(uri), pool_pre_ping=True, **pool_args(make_url(uri)))
+        configure_engine(replica.sync_engine)
+        engines.append(replica)
+    with _lock:
+        dropped = replica_engines[:]
+        replica_engines[:] = engines
+        _replica_sessions[:] = [
+            async_sessionmaker(replica, autoflush=False, expire_on_commit=False) for replica in engines
+        ]
+        _next_replica = itertools.cycle(_replica_sessions[:])
+    return dropped
+
+
+configure_replicas([uri.strip() for uri in settings.SQLALCHEMY_REPLICA_URIS.split(",") if uri.strip()])
+
+
+def primary_deadline() -> str:
+    return f"{time.time() + settings.REPLICA_STICKY_SECONDS:.3f}"
+
+
+def pinned_to_primary(request: Request) -> bool:
+    """True when replicas are in use and this client wrote recently.
+
+    Write responses carry an ``X-Read-Primary`` deadline that the API clients
+    echo on later requests; an unexpired one pins only that client to the
+    primary while everyone else keeps reading from the replicas.
+    """
+    if not _replica_sessions:
+        return False
+    try:
+        return float(request.headers.get(PRIMARY_HEADER, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def use_primary(request: Request) -> bool:
+    return not _replica_sessions or pinned_to_primary(request)
+
+
+def read_session_factory(request: Request) -> async_sessionmaker:
+    if use_primary(request):
+        return AsyncSessionLocal
+    with _lock:
+        return next(_next_replica)
+
+
+async def dispose_replicas() -> None:
+    for replica in replica_engines:
+        await replica.dispose()
@@ -1,17 +1,105 @@
-from sqlalchemy import create_engine
+import logging
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mariadb": "mariadb+aiomysql",
+}
+
+database_url = make_url(settings.SQLALCHEMY_DATABASE_URI)
+is_sqlite = database_url.get_backend_name() == "sqlite"
+
 connect_args = {}
-if settings.SQLALCHEMY_DATABASE_URI.startswith("sqlite"):
+if is_sqlite:
     connect_args = {"check_same_thread": False}
 
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
-    future=True,
-    connect_args=connect_args,
+
+def pool_args(url: URL) -> dict:
+    # In-memory SQLite is served from a single-connection pool that takes no sizing.
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+    finally:
+        cursor.close()
+
+
+def configure_engine(target: Engine) -> Engine:
+    if target.dialect.name == "sqlite":
+        event.listen(target, "connect", _apply_sqlite_pragmas)
+    return target
+
+
+engine = configure_engine(
+    create_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        pool_pre_ping=True,
+        future=True,
+        connect_args=connect_args,
+        **pool_args(database_url),
+    )
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def async_database_uri(uri: str) -> str:
+    url = make_url(uri)
+    if url.get_dialect().is_async:
+        return uri
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise RuntimeError(f"No async driver configured for {url.drivername}; set ASYNC_DATABASE_URI")
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URI or async_database_uri(settings.SQLALCHEMY_DATABASE_URI),
+    pool_pre_ping=True,
+    **pool_args(database_url),
+)
+configure_engine(async_engine.sync_engine)
+
+# Async sessions wrap the same Session subclass as SessionLocal, so the
+# after_flush/after_commit listeners registered on SessionLocal still fire.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    sync_session_class=SessionLocal.class_,
+)
+
+
+def log_database_profile() -> None:
+    """Log the pool sizing and, on SQLite, the pragmas a fresh connection actually runs with."""
+    logger.info("Database pool: %s", engine.pool.status())
+    if not is_sqlite:
+        return
+    pragmas = ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")
+    with engine.connect() as connection:
+        values = {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in pragmas}
+    logger.info("SQLite pragmas: %s", ", ".join(f"{name}={value}" for name, value in values.items()))
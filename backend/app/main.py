@@ -1,12 +1,24 @@
+import logging
+import time
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from app.api.pagination import NEXT_CURSOR_HEADER
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.security import PasswordHashingBusy
 from app.db.init_db import init_db
+from app.db.replicas import PRIMARY_HEADER, SAFE_METHODS, dispose_replicas, primary_deadline, replica_engines
+from app.db.session import async_engine, log_database_profile
+from app.services.autosave import flush_drafts, flusher
+from app.services.counters import reconciler
+from app.services.exam_sweeper import sweeper
+
+logger = logging.getLogger(__name__)
 
 app = FastAPI(title=settings.PROJECT_NAME)
 
@@ -26,12 +38,60 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, PRIMARY_HEADER],
 )
 
 
+@app.middleware("http")
+async def stick_writers_to_primary(request: Request, call_next):
+    # A client that just wrote keeps reading from the primary until replicas catch up.
+    response = await call_next(request)
+    if replica_engines and request.method not in SAFE_METHODS and response.status_code < 400:
+        response.headers[PRIMARY_HEADER] = primary_deadline()
+    return response
+
+
+@app.exception_handler(PasswordHashingBusy)
+def password_hashing_busy(request: Request, exc: PasswordHashingBusy) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many login attempts in progress, please retry"},
+        headers={"Retry-After": "2"},
+    )
+
+
 @app.on_event("startup")
 def on_startup() -> None:
-    init_db()
+    timings = {}
+
+    def phase(name, func):
+        started = time.perf_counter()
+        result = func()
+        timings[name] = (time.perf_counter() - started) * 1000
+        return result
+
+    phase("database_profile", log_database_profile)
+    full_init = phase("init_db", init_db)
+    phase("background_tasks", lambda: (flusher.start(), sweeper.start(), reconciler.start()))
+    logger.info(
+        "Startup (%s): %s",
+        "full init" if full_init else "schema current",
+        ", ".join(f"{name}={ms:.1f}ms" for name, ms in timings.items()),
+    )
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    reconciler.stop()
+    sweeper.stop()
+    flusher.stop()
+    flush_drafts()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine() -> None:
+    await async_engine.dispose()
+    await dispose_replicas()
 
 
 @app.get("/")
@@ -7,4 +7,9 @@ from app.models.fee import Fee
 from app.models.expense import Expense
 from app.models.certificate import Certificate
 from app.models.gallery import Gallery
-from app.models.exam import Exam, ExamAnswer, ExamAttempt, ExamOption, ExamQuestion
+from app.models.exam import Exam, ExamAnswer, ExamAttempt, ExamOption, ExamQuestion, RegradeJob
+from app.models.dashboard import DashboardCounter
+from app.models.finance import FinanceDailyRollup
+from app.models.collection_version import CollectionVersion
+from app.models.schema_migration import SchemaMigration
+from app.models.schema_state import SchemaState
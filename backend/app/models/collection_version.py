@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String
+
+from app.db.base import Base
+
+
+class CollectionVersion(Base):
+    __tablename__ = "collection_versions"
+
+    name = Column(String(80), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
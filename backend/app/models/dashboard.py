@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, Numeric, String
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DashboardCounter(Base):
+    __tablename__ = "dashboard_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(Numeric(14, 2), nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
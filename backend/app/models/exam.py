@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, Numeric, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, Numeric, String, Text
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -18,6 +19,7 @@ class Exam(Base):
     is_active = Column(Boolean, default=True)
     start_at = Column(DateTime(timezone=True), nullable=True)
     end_at = Column(DateTime(timezone=True), nullable=True)
+    content_version = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -31,12 +33,14 @@ class ExamQuestion(Base):
     negative_marks = Column(Numeric(6, 2), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    options = relationship("ExamOption", order_by="ExamOption.id", lazy="selectin")
+
 
 class ExamOption(Base):
     __tablename__ = "exam_options"
 
     id = Column(Integer, primary_key=True, index=True)
-    question_id = Column(Integer, nullable=False, index=True)
+    question_id = Column(Integer, ForeignKey("exam_questions.id"), nullable=False, index=True)
     option_text = Column(Text, nullable=False)
     is_correct = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -44,6 +48,10 @@ class ExamOption(Base):
 
 class ExamAttempt(Base):
     __tablename__ = "exam_attempts"
+    __table_args__ = (
+        Index("ix_exam_attempts_status_exam_started", "status", "exam_id", "started_at"),
+        Index("ix_exam_attempts_exam_student", "exam_id", "student_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     exam_id = Column(Integer, nullable=False, index=True)
@@ -52,10 +60,12 @@ class ExamAttempt(Base):
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     total_score = Column(Numeric(8, 2), nullable=True)
     status = Column(String(30), default="in_progress")
+    draft_answers = Column(Text, nullable=True)
 
 
 class ExamAnswer(Base):
     __tablename__ = "exam_answers"
+    __table_args__ = (Index("ix_exam_answers_attempt_question", "attempt_id", "question_id"),)
 
     id = Column(Integer, primary_key=True, index=True)
     attempt_id = Column(Integer, nullable=False, index=True)
@@ -63,3 +73,16 @@ class ExamAnswer(Base):
     option_id = Column(Integer, nullable=False, index=True)
     is_correct = Column(Boolean, default=False)
     marks_awarded = Column(Numeric(6, 2), nullable=True)
+
+
+class RegradeJob(Base):
+    __tablename__ = "regrade_jobs"
+
+    exam_id = Column(Integer, primary_key=True)
+    status = Column(String(20), nullable=False, default="queued")
+    total = Column(Integer, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    error = Column(Text, nullable=True)
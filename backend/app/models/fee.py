@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Index, Integer, Numeric, String
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -6,6 +6,7 @@ from app.db.base import Base
 
 class Fee(Base):
     __tablename__ = "fees"
+    __table_args__ = (Index("ix_fees_student_paid_on", "student_id", "paid_on"),)
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(Integer, ForeignKey("students.id"), nullable=False)
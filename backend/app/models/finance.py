@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Date, Integer, Numeric, String, UniqueConstraint
+
+from app.db.base import Base
+
+
+class FinanceDailyRollup(Base):
+    __tablename__ = "finance_daily_rollups"
+    __table_args__ = (UniqueConstraint("day", "kind", "category", name="uq_finance_rollup_bucket"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    day = Column(Date, nullable=False, index=True)
+    kind = Column(String(20), nullable=False)
+    category = Column(String(80), nullable=False, default="")
+    amount = Column(Numeric(14, 2), nullable=False, default=0)
+    entries = Column(Integer, nullable=False, default=0)
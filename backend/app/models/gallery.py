@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, Integer, String, Text
 from sqlalchemy.sql import func
 
 from app.db.base import Base
@@ -12,4 +12,6 @@ class Gallery(Base):
     title = Column(String(200), nullable=True)
     url = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
+    srcset = Column(JSON, nullable=True)
+    placeholder = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class SchemaMigration(Base):
+    __tablename__ = "schema_migrations"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String(120), nullable=False)
+    applied_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class SchemaState(Base):
+    __tablename__ = "schema_state"
+
+    name = Column(String(50), primary_key=True)
+    fingerprint = Column(String(64), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel, EmailStr
 
 
@@ -9,3 +11,24 @@ class Token(BaseModel):
 class LoginRequest(BaseModel):
     email: EmailStr
     password: str
+
+
+class PasswordPoolStats(BaseModel):
+    workers: int
+    max_queue: int
+    queued: int
+    running: int
+    completed: int
+    rejected: int
+
+
+class PasswordBenchmarkResult(BaseModel):
+    rounds: int
+    milliseconds: float
+    accounts: List[str] = []
+
+
+class PasswordBenchmark(BaseModel):
+    staff_rounds: int
+    student_rounds: int
+    results: List[PasswordBenchmarkResult]
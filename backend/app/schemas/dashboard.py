@@ -1,3 +1,6 @@
+from datetime import date
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel
 
 
@@ -9,3 +12,21 @@ class DashboardSummary(BaseModel):
     total_expenses: float
     total_certificates: int
     total_gallery_items: int
+
+
+class FinancePoint(BaseModel):
+    period: str
+    income: float
+    expense: float
+    net: float
+
+
+class FinanceSummary(BaseModel):
+    granularity: str
+    start: Optional[date] = None
+    end: Optional[date] = None
+    total_income: float
+    total_expense: float
+    series: List[FinancePoint]
+    fees_by_mode: Dict[str, float]
+    expenses_by_category: Dict[str, float]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -100,23 +100,66 @@ class ExamAttemptOut(BaseModel):
         orm_mode = True
 
 
+class ExamAnswerSubmit(BaseModel):
+    question_id: int
+    option_id: int
+
+
 class ExamStartResponse(BaseModel):
     attempt_id: int
+    saved_answers: List[ExamAnswerSubmit] = []
     exam: ExamOut
     questions: List[ExamQuestionOut]
 
 
-class ExamAnswerSubmit(BaseModel):
-    question_id: int
-    option_id: int
+class ExamAutosaveRequest(BaseModel):
+    attempt_id: int
+    answers: List[ExamAnswerSubmit]
 
 
 class ExamSubmitRequest(BaseModel):
     attempt_id: int
-    answers: List[ExamAnswerSubmit]
+    answers: List[ExamAnswerSubmit] = []
 
 
 class ExamSubmitResponse(BaseModel):
     attempt_id: int
     total_score: float
     status: str
+
+
+class ExamRegradeStatus(BaseModel):
+    exam_id: int
+    status: str
+    total: int = 0
+    processed: int = 0
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class ScoreBucket(BaseModel):
+    lower: float
+    upper: float
+    count: int
+
+
+class ExamQuestionStats(BaseModel):
+    question_id: int
+    answered: int
+    correct: int
+    difficulty: Optional[float] = None
+    discrimination: Optional[float] = None
+
+
+class ExamAnalytics(BaseModel):
+    exam_id: int
+    attempts: int
+    mean: Optional[float] = None
+    median: Optional[float] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+    percentiles: Dict[str, float] = {}
+    pass_rate: Optional[float] = None
+    histogram: List[ScoreBucket] = []
+    questions: List[ExamQuestionStats] = []
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 
@@ -25,6 +25,8 @@ class GalleryUpdate(BaseModel):
 class GalleryOut(GalleryBase):
     id: int
     created_at: datetime
+    srcset: Optional[Dict[str, str]] = None
+    placeholder: Optional[str] = None
 
     class Config:
         orm_mode = True
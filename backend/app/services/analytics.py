@@ -0,0 +1,157 @@
+from array import array
+from math import floor
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.models.exam import Exam, ExamAnswer, ExamAttempt, ExamQuestion
+
+HISTOGRAM_BINS = 10
+DISCRIMINATION_GROUP = 0.27
+STREAM_BATCH_SIZE = 2000
+
+_results = LRUCache(maxsize=64)
+
+
+def _percentile(sorted_scores: array, pct: float) -> float:
+    if not sorted_scores:
+        return 0.0
+    position = (len(sorted_scores) - 1) * pct / 100
+    lower = floor(position)
+    upper = min(lower + 1, len(sorted_scores) - 1)
+    weight = position - lower
+    return sorted_scores[lower] * (1 - weight) + sorted_scores[upper] * weight
+
+
+def _histogram(sorted_scores: array, max_marks: float | None) -> list[dict]:
+    if not sorted_scores:
+        return []
+    low = min(0.0, sorted_scores[0])
+    high = max(max_marks or 0.0, sorted_scores[-1])
+    width = (high - low) / HISTOGRAM_BINS or 1.0
+    counts = array("l", [0] * HISTOGRAM_BINS)
+    for score in sorted_scores:
+        counts[min(int((score - low) / width), HISTOGRAM_BINS - 1)] += 1
+    return [
+        {"lower": low + i * width, "upper": low + (i + 1) * width, "count": counts[i]}
+        for i in range(HISTOGRAM_BINS)
+    ]
+
+
+def _fingerprint(db: Session, exam: Exam) -> tuple:
+    count, last_submitted, score_sum = (
+        db.query(
+            func.count(ExamAttempt.id),
+            func.max(ExamAttempt.submitted_at),
+            func.sum(ExamAttempt.total_score),
+        )
+        .filter(ExamAttempt.exam_id == exam.id, ExamAttempt.status == "submitted")
+        .one()
+    )
+    return count, last_submitted, score_sum, exam.content_version
+
+
+def _compute(db: Session, exam: Exam) -> dict:
+    # Columnar buffers: one slot per attempt, one slot per answer row.
+    scores = array("d")
+    answer_attempt = array("l")
+    answer_question = array("q")
+    answer_correct = array("b")
+
+    rows = (
+        db.query(ExamAttempt.id, ExamAttempt.total_score, ExamAnswer.question_id, ExamAnswer.is_correct)
+        .outerjoin(ExamAnswer, ExamAnswer.attempt_id == ExamAttempt.id)
+        .filter(ExamAttempt.exam_id == exam.id, ExamAttempt.status == "submitted")
+        .order_by(ExamAttempt.id)
+        .yield_per(STREAM_BATCH_SIZE)
+    )
+    last_attempt_id = None
+    for attempt_id, total_score, question_id, is_correct in rows:
+        if attempt_id != last_attempt_id:
+            scores.append(float(total_score or 0))
+            last_attempt_id = attempt_id
+        if question_id is not None:
+            answer_attempt.append(len(scores) - 1)
+            answer_question.append(question_id)
+            answer_correct.append(1 if is_correct else 0)
+
+    attempts = len(scores)
+    sorted_scores = array("d", sorted(scores))
+
+    pass_rate = None
+    if exam.pass_marks is not None and attempts:
+        pass_marks = float(exam.pass_marks)
+        pass_rate = sum(1 for score in scores if score >= pass_marks) / attempts
+
+    # Upper/lower 27% groups by total score for the discrimination index.
+    group_size = max(1, round(attempts * DISCRIMINATION_GROUP)) if attempts else 0
+    ranked = sorted(range(attempts), key=scores.__getitem__)
+    group = bytearray(attempts)
+    for index in ranked[:group_size]:
+        group[index] = 1
+    for index in ranked[attempts - group_size:]:
+        group[index] = 2
+
+    question_ids = [
+        row[0]
+        for row in db.query(ExamQuestion.id).filter(ExamQuestion.exam_id == exam.id).order_by(ExamQuestion.id)
+    ]
+    answered = dict.fromkeys(question_ids, 0)
+    correct = dict.fromkeys(question_ids, 0)
+    upper_correct = dict.fromkeys(question_ids, 0)
+    lower_correct = dict.fromkeys(question_ids, 0)
+    for attempt_index, question_id, is_correct in zip(answer_attempt, answer_question, answer_correct):
+        if question_id not in answered:
+            continue
+        answered[question_id] += 1
+        if not is_correct:
+            continue
+        correct[question_id] += 1
+        if group[attempt_index] == 2:
+            upper_correct[question_id] += 1
+        elif group[attempt_index] == 1:
+            lower_correct[question_id] += 1
+
+    questions = []
+    for question_id in question_ids:
+        questions.append(
+            {
+                "question_id": question_id,
+                "answered": answered[question_id],
+                "correct": correct[question_id],
+                "difficulty": correct[question_id] / attempts if attempts else None,
+                "discrimination": (
+                    (upper_correct[question_id] - lower_correct[question_id]) / group_size
+                    if group_size
+                    else None
+                ),
+            }
+        )
+
+    return {
+        "exam_id": exam.id,
+        "attempts": attempts,
+        "mean": sum(scores) / attempts if attempts else None,
+        "median": _percentile(sorted_scores, 50) if attempts else None,
+        "min_score": sorted_scores[0] if attempts else None,
+        "max_score": sorted_scores[-1] if attempts else None,
+        "percentiles": {
+            str(pct): _percentile(sorted_scores, pct) for pct in (10, 25, 50, 75, 90)
+        } if attempts else {},
+        "pass_rate": pass_rate,
+        "histogram": _histogram(sorted_scores, float(exam.total_marks) if exam.total_marks is not None else None),
+        "questions": questions,
+    }
+
+
+def get_exam_analytics(db: Session, exam: Exam) -> dict:
+    """Score and item statistics for ``exam``, cached until its submissions change."""
+    fingerprint = _fingerprint(db, exam)
+    cached = _results.get(exam.id)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    result = _compute(db, exam)
+    _results.set(exam.id, (fingerprint, result))
+    return result
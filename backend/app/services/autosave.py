@@ -0,0 +1,139 @@
+import json
+import threading
+
+from sqlalchemy import bindparam, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.db.session import SessionLocal
+from app.models.exam import ExamAttempt
+
+_pending: dict[int, dict[int, int]] = {}
+_pending_count = 0
+# Deltas handed to the last flush. They stay readable until the next flush
+# starts, so a submit racing the flush commit still grades them.
+_flushing: dict[int, dict[int, int]] = {}
+_lock = threading.Lock()
+_flush_lock = threading.Lock()
+
+
+def _load_draft(raw: str | None) -> dict[int, int]:
+    if not raw:
+        return {}
+    return {int(question_id): option_id for question_id, option_id in json.loads(raw).items()}
+
+
+def _dump_draft(draft: dict[int, int]) -> str:
+    return json.dumps({str(question_id): option_id for question_id, option_id in draft.items()})
+
+
+def buffer_answers(attempt_id: int, answers: dict[int, int]) -> None:
+    """Queue answer deltas for an attempt; the flusher writes them in batches."""
+    global _pending_count
+    with _lock:
+        draft = _pending.setdefault(attempt_id, {})
+        before = len(draft)
+        draft.update(answers)
+        _pending_count += len(draft) - before
+        full = _pending_count >= settings.AUTOSAVE_MAX_PENDING
+    if full:
+        flusher.trigger()
+
+
+def _start_flush() -> dict[int, dict[int, int]]:
+    global _pending, _pending_count, _flushing
+    with _lock:
+        _flushing, _pending, _pending_count = _pending, {}, 0
+        return _flushing
+
+
+def _take_pending(attempt_id: int) -> dict[int, int]:
+    global _pending_count
+    with _lock:
+        draft = _flushing.pop(attempt_id, {})
+        pending = _pending.pop(attempt_id, None)
+        if pending is not None:
+            _pending_count -= len(pending)
+            draft.update(pending)
+        return draft
+
+
+def pending_answers(attempt_id: int) -> dict[int, int]:
+    with _lock:
+        draft = dict(_flushing.get(attempt_id, {}))
+        draft.update(_pending.get(attempt_id, {}))
+        return draft
+
+
+def saved_answers(attempt: ExamAttempt) -> dict[int, int]:
+    """Stored draft merged with deltas still waiting in this worker's buffer."""
+    draft = _load_draft(attempt.draft_answers)
+    draft.update(pending_answers(attempt.id))
+    return draft
+
+
+def take_answers(attempt_id: int, raw_draft: str | None) -> dict[int, int]:
+    """Stored draft merged with buffered deltas, draining the buffer, for submit time."""
+    draft = _load_draft(raw_draft)
+    draft.update(_take_pending(attempt_id))
+    return draft
+
+
+def _recount() -> None:
+    global _pending_count
+    _pending_count = sum(len(draft) for draft in _pending.values())
+
+
+def _write_drafts(db: Session, pending: dict[int, dict[int, int]]) -> None:
+    # Lock the drafts (in id order, so overlapping flushes cannot deadlock) until
+    # the merged values commit: a flush from another worker then waits and merges
+    # into this one's result instead of both overwriting the same old draft.
+    attempts = (
+        db.query(ExamAttempt.id, ExamAttempt.draft_answers)
+        .filter(ExamAttempt.id.in_(list(pending)), ExamAttempt.status == "in_progress")
+        .order_by(ExamAttempt.id)
+        .with_for_update()
+        .all()
+    )
+    rows = []
+    for attempt_id, raw in attempts:
+        draft = _load_draft(raw)
+        draft.update(pending[attempt_id])
+        rows.append({"attempt_id": attempt_id, "draft": _dump_draft(draft)})
+    if rows:
+        # Conditional on status so an attempt submitted since the SELECT keeps its cleared draft.
+        table = ExamAttempt.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("attempt_id"), table.c.status == "in_progress")
+            .values(draft_answers=bindparam("draft")),
+            rows,
+        )
+    db.commit()
+
+
+def flush_drafts() -> None:
+    with _flush_lock:
+        pending = _start_flush()
+        if not pending:
+            return
+
+        db = SessionLocal()
+        try:
+            _write_drafts(db, pending)
+        except Exception:
+            db.rollback()
+            with _lock:
+                for attempt_id in list(_flushing):
+                    answers = _flushing.pop(attempt_id)
+                    draft = _pending.setdefault(attempt_id, {})
+                    for question_id, option_id in answers.items():
+                        draft.setdefault(question_id, option_id)
+                _recount()
+            raise
+        finally:
+            db.close()
+
+
+flusher = PeriodicTask("exam-autosave", settings.AUTOSAVE_FLUSH_INTERVAL_SECONDS, flush_drafts)
@@ -0,0 +1,138 @@
+import logging
+from collections import defaultdict
+from decimal import Decimal
+
+from sqlalchemy import event, func, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.db.session import SessionLocal
+from app.models.certificate import Certificate
+from app.models.course import Course
+from app.models.dashboard import DashboardCounter
+from app.models.enquiry import Enquiry
+from app.models.expense import Expense
+from app.models.fee import Fee
+from app.models.gallery import Gallery
+from app.models.student import Student
+from app.services.rollups import rebuild_rollups
+
+logger = logging.getLogger(__name__)
+
+# Counter names match the DashboardSummary fields they back.
+COUNTED_MODELS = {
+    Student: "total_students",
+    Course: "total_courses",
+    Enquiry: "total_enquiries",
+    Certificate: "total_certificates",
+    Gallery: "total_gallery_items",
+}
+SUMMED_MODELS = {
+    Fee: "total_fees",
+    Expense: "total_expenses",
+}
+COUNTER_NAMES = [*COUNTED_MODELS.values(), *SUMMED_MODELS.values()]
+
+
+def _amount(value) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal(0)
+
+
+def _collect_deltas(session: Session) -> dict[str, Decimal]:
+    deltas: dict[str, Decimal] = defaultdict(Decimal)
+    for obj, sign in [*((obj, 1) for obj in session.new), *((obj, -1) for obj in session.deleted)]:
+        model = type(obj)
+        if model in COUNTED_MODELS:
+            deltas[COUNTED_MODELS[model]] += sign
+        elif model in SUMMED_MODELS:
+            history = inspect(obj).attrs.amount.history
+            value = history.deleted[0] if sign < 0 and history.deleted else obj.amount
+            deltas[SUMMED_MODELS[model]] += sign * _amount(value)
+
+    for obj in session.dirty:
+        model = type(obj)
+        if model not in SUMMED_MODELS:
+            continue
+        history = inspect(obj).attrs.amount.history
+        if history.added or history.deleted:
+            added = sum((_amount(value) for value in history.added), Decimal(0))
+            removed = sum((_amount(value) for value in history.deleted), Decimal(0))
+            deltas[SUMMED_MODELS[model]] += added - removed
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _apply_counter_deltas(session: Session, flush_context) -> None:
+    deltas = _collect_deltas(session)
+    if not deltas:
+        return
+    connection = session.connection()
+    for name, delta in deltas.items():
+        connection.execute(
+            update(DashboardCounter.__table__)
+            .where(DashboardCounter.name == name)
+            .values(value=DashboardCounter.value + delta, updated_at=func.now())
+        )
+
+
+def _aggregates() -> dict:
+    expressions = {
+        name: select(func.count(model.id)).scalar_subquery() for model, name in COUNTED_MODELS.items()
+    }
+    for model, name in SUMMED_MODELS.items():
+        expressions[name] = select(func.coalesce(func.sum(model.amount), 0)).scalar_subquery()
+    return expressions
+
+
+def reconcile_counters(db: Session) -> dict[str, Decimal]:
+    """Recompute every counter from the source tables and correct any drift.
+
+    The counter rows are locked first and each one is rewritten by a single
+    UPDATE that computes its aggregate in the same statement, so a delta from
+    a concurrent write is either already in the aggregate or applied on top
+    of the corrected value afterwards -- never overwritten.
+    """
+    existing = set(
+        db.scalars(
+            select(DashboardCounter.name).where(DashboardCounter.name.in_(COUNTER_NAMES)).with_for_update()
+        )
+    )
+    for name, aggregate in _aggregates().items():
+        if name not in existing:
+            db.execute(insert(DashboardCounter.__table__).values(name=name, value=aggregate))
+            continue
+        result = db.execute(
+            update(DashboardCounter)
+            .where(DashboardCounter.name == name, DashboardCounter.value != aggregate)
+            .values(value=aggregate, updated_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            logger.info("Dashboard counter %s drifted; recomputed from source tables", name)
+    db.commit()
+    counters = db.query(DashboardCounter.name, DashboardCounter.value)
+    return dict(counters.filter(DashboardCounter.name.in_(COUNTER_NAMES)).all())
+
+
+def read_counters(db: Session) -> dict[str, Decimal]:
+    values = dict(db.query(DashboardCounter.name, DashboardCounter.value).all())
+    if any(name not in values for name in COUNTER_NAMES):
+        values = reconcile_counters(db)
+    return values
+
+
+def _reconcile_job() -> None:
+    db = SessionLocal()
+    try:
+        reconcile_counters(db)
+        rebuild_rollups(db)
+    finally:
+        db.close()
+
+
+reconciler = PeriodicTask(
+    "dashboard-reconcile",
+    settings.DASHBOARD_RECONCILE_INTERVAL_SECONDS,
+    _reconcile_job,
+)
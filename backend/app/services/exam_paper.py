@@ -0,0 +1,80 @@
+import json
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.exam import Exam, ExamQuestion
+from app.schemas.exam import ExamOut, ExamQuestionOut
+
+_papers = LRUCache(maxsize=settings.EXAM_PAPER_CACHE_SIZE)
+
+
+def question_out(question: ExamQuestion, include_answers: bool = True) -> ExamQuestionOut:
+    return ExamQuestionOut(
+        id=question.id,
+        question_text=question.question_text,
+        marks=float(question.marks) if question.marks is not None else 1,
+        negative_marks=float(question.negative_marks) if question.negative_marks is not None else None,
+        options=[
+            {
+                "id": opt.id,
+                "option_text": opt.option_text,
+                "is_correct": opt.is_correct if include_answers else False,
+            }
+            for opt in question.options
+        ],
+    )
+
+
+def _build_paper(db: Session, exam: Exam) -> bytes:
+    questions = (
+        db.query(ExamQuestion)
+        .filter(ExamQuestion.exam_id == exam.id)
+        .order_by(ExamQuestion.id)
+        .all()
+    )
+    paper = {
+        "exam": ExamOut.from_orm(exam),
+        "questions": [question_out(q, include_answers=False) for q in questions],
+    }
+    return json.dumps(jsonable_encoder(paper), separators=(",", ":")).encode()
+
+
+def get_paper(db: Session, exam: Exam) -> bytes:
+    """Answer-stripped ``{"exam": ..., "questions": ...}`` JSON for an exam.
+
+    Entries are keyed by ``exam.content_version`` so a stale paper built by a
+    request racing an admin edit is never served once the edit is committed.
+    """
+    cached = _papers.get(exam.id)
+    if cached and cached[0] == exam.content_version:
+        return cached[1]
+
+    payload = _build_paper(db, exam)
+    _papers.set(exam.id, (exam.content_version, payload))
+    return payload
+
+
+def render_start_response(attempt_id: int, paper: bytes, saved_answers: dict[int, int]) -> bytes:
+    saved = json.dumps(
+        [{"question_id": question_id, "option_id": option_id} for question_id, option_id in saved_answers.items()],
+        separators=(",", ":"),
+    )
+    return b'{"attempt_id":%d,"saved_answers":%s,' % (attempt_id, saved.encode()) + paper[1:]
+
+
+def bump_exam_version(db: Session, exam_id: int | None) -> None:
+    if exam_id is None:
+        return
+    db.query(Exam).filter(Exam.id == exam_id).update(
+        {Exam.content_version: func.coalesce(Exam.content_version, 0) + 1},
+        synchronize_session=False,
+    )
+
+
+def invalidate_paper(exam_id: int | None) -> None:
+    if exam_id is not None:
+        _papers.pop(exam_id)
@@ -0,0 +1,112 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import or_, true
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.db.session import SessionLocal
+from app.models.exam import Exam, ExamAttempt
+from app.services.autosave import take_answers
+from app.services.grading import get_answer_key, save_answers
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Naive UTC like ``datetime.utcnow()``; aware values are converted, not truncated."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def attempt_deadline(exam: Exam, started_at: datetime) -> datetime:
+    deadline = _as_utc(started_at) + timedelta(minutes=exam.duration_minutes)
+    if exam.end_at is not None:
+        deadline = min(deadline, _as_utc(exam.end_at))
+    return deadline
+
+
+def _expired_filter(exam: Exam, now: datetime):
+    deadline = now - timedelta(minutes=exam.duration_minutes)
+    conditions = [ExamAttempt.started_at <= deadline]
+    if exam.end_at is not None and _as_utc(exam.end_at) <= now:
+        conditions.append(true())
+    return or_(*conditions)
+
+
+def _sweep_batch(db: Session, exam: Exam, now: datetime) -> int:
+    """Claim and auto-submit up to one batch of expired attempts of ``exam``.
+
+    Attempts are claimed with a conditional UPDATE to a per-batch token, so a
+    concurrent sweeper in another worker cannot grade the same attempt twice.
+    """
+    expired_ids = (
+        db.query(ExamAttempt.id)
+        .filter(
+            ExamAttempt.exam_id == exam.id,
+            ExamAttempt.status == "in_progress",
+            _expired_filter(exam, now),
+        )
+        .order_by(ExamAttempt.id)
+        .limit(settings.EXAM_SWEEP_BATCH_SIZE)
+    )
+    token = f"sweeping:{uuid4().hex[:16]}"
+    db.query(ExamAttempt).filter(
+        ExamAttempt.id.in_([row[0] for row in expired_ids]),
+        ExamAttempt.status == "in_progress",
+    ).update({ExamAttempt.status: token}, synchronize_session=False)
+
+    claimed = db.query(ExamAttempt.id, ExamAttempt.draft_answers).filter(ExamAttempt.status == token).all()
+    if not claimed:
+        db.rollback()
+        return 0
+
+    answer_key = get_answer_key(db, exam)
+    answer_rows = []
+    attempt_rows = []
+    for attempt_id, raw_draft in claimed:
+        total_score, rows = answer_key.grade(attempt_id, take_answers(attempt_id, raw_draft))
+        answer_rows.extend(rows)
+        attempt_rows.append(
+            {
+                "id": attempt_id,
+                "status": "submitted",
+                "submitted_at": now,
+                "total_score": total_score,
+                "draft_answers": None,
+            }
+        )
+    save_answers(db, answer_rows)
+    db.bulk_update_mappings(ExamAttempt, attempt_rows)
+    db.commit()
+    return len(claimed)
+
+
+def sweep_expired_attempts() -> int:
+    now = datetime.utcnow()
+    db = SessionLocal()
+    submitted = 0
+    try:
+        exam_ids = db.query(ExamAttempt.exam_id).filter(ExamAttempt.status == "in_progress").distinct()
+        exams = db.query(Exam).filter(Exam.id.in_(exam_ids)).all()
+        for exam in exams:
+            while True:
+                count = _sweep_batch(db, exam, now)
+                submitted += count
+                if count < settings.EXAM_SWEEP_BATCH_SIZE:
+                    break
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    if submitted:
+        logger.info("Auto-submitted %s expired exam attempts", submitted)
+    return submitted
+
+
+sweeper = PeriodicTask("exam-expiry-sweeper", settings.EXAM_SWEEP_INTERVAL_SECONDS, sweep_expired_attempts)
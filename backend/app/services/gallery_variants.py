@@ -0,0 +1,67 @@
+import logging
+from pathlib import Path
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.api.response_cache import invalidate
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.gallery import Gallery
+from app.services.images import InvalidImage, parse_formats, render_variants_async
+
+logger = logging.getLogger(__name__)
+
+
+def variant_widths() -> list[int]:
+    return [int(width) for width in settings.GALLERY_VARIANT_WIDTHS.split(",") if width.strip()]
+
+
+def variant_paths(upload_dir: Path, url: str) -> list[Path]:
+    stem = Path(url).stem
+    return [path for path in upload_dir.glob(f"{stem}_*w.*") if path.is_file()]
+
+
+def _store(item_id: int, url: str, srcset: dict[str, str], placeholder: str) -> bool:
+    db = SessionLocal()
+    try:
+        item = db.get(Gallery, item_id)
+        # The item may have been deleted or pointed at another file meanwhile.
+        if item is None or item.url != url:
+            return False
+        item.srcset = srcset
+        item.placeholder = placeholder
+        db.commit()
+        return True
+    finally:
+        db.close()
+
+
+async def build_gallery_variants(item_id: int, upload_dir: Path, url: str) -> None:
+    """Write the width variants and placeholder for one uploaded photo and record them on the item."""
+    source = upload_dir / Path(url).name
+    try:
+        data = await run_in_threadpool(source.read_bytes)
+        rendered = await render_variants_async(
+            data,
+            variant_widths(),
+            parse_formats(settings.GALLERY_VARIANT_FORMATS),
+            settings.IMAGE_QUALITY,
+        )
+    except (OSError, InvalidImage):
+        logger.warning("Could not build variants for gallery item %s", item_id, exc_info=True)
+        return
+
+    srcset = {}
+    written = []
+    for width, variant in sorted(rendered.variants.items()):
+        name = f"{source.stem}_{width}w{variant.extension}"
+        await run_in_threadpool((upload_dir / name).write_bytes, variant.data)
+        written.append(upload_dir / name)
+        srcset[f"{width}w"] = f"/uploads/{name}"
+    srcset[f"{rendered.width}w"] = url
+
+    if await run_in_threadpool(_store, item_id, url, srcset, rendered.placeholder):
+        invalidate("gallery")
+    else:
+        for path in written:
+            path.unlink(missing_ok=True)
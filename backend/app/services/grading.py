@@ -0,0 +1,110 @@
+from array import array
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.models.exam import Exam, ExamAnswer, ExamOption, ExamQuestion
+
+_answer_keys = LRUCache(maxsize=settings.ANSWER_KEY_CACHE_SIZE)
+
+
+class AnswerKey:
+    """Compiled grading data for one version of an exam.
+
+    Options are stored in parallel arrays (question id, correct flag, marks,
+    resolved negative marks) and ``option_index`` maps an option id to its
+    slot, so grading an answer sheet never touches the database.
+    """
+
+    __slots__ = ("version", "option_index", "question_ids", "correct", "marks", "negatives")
+
+    def __init__(self, version: int | None) -> None:
+        self.version = version
+        self.option_index: dict[int, int] = {}
+        self.question_ids = array("q")
+        self.correct = array("b")
+        self.marks = array("d")
+        self.negatives = array("d")
+
+    def score(self, question_id: int, option_id: int) -> tuple[bool, float] | None:
+        slot = self.option_index.get(option_id)
+        if slot is None or self.question_ids[slot] != question_id:
+            return None
+        if self.correct[slot]:
+            return True, self.marks[slot]
+        return False, -self.negatives[slot]
+
+    def grade(self, attempt_id: int, answers_map: dict[int, int]) -> tuple[float, list[dict]]:
+        total_score = 0.0
+        rows = []
+        for question_id, option_id in answers_map.items():
+            if not option_id:
+                continue
+            result = self.score(question_id, option_id)
+            if result is None:
+                continue
+
+            is_correct, marks_awarded = result
+            total_score += marks_awarded
+            rows.append(
+                {
+                    "attempt_id": attempt_id,
+                    "question_id": question_id,
+                    "option_id": option_id,
+                    "is_correct": is_correct,
+                    "marks_awarded": marks_awarded,
+                }
+            )
+        return total_score, rows
+
+
+def compile_answer_key(db: Session, exam: Exam) -> AnswerKey:
+    default_negative = 0.0
+    if exam.negative_marking_enabled and exam.negative_mark_value is not None:
+        default_negative = float(exam.negative_mark_value)
+
+    rows = (
+        db.query(
+            ExamQuestion.id,
+            ExamQuestion.marks,
+            ExamQuestion.negative_marks,
+            ExamOption.id,
+            ExamOption.is_correct,
+        )
+        .join(ExamOption, ExamOption.question_id == ExamQuestion.id)
+        .filter(ExamQuestion.exam_id == exam.id)
+        .order_by(ExamQuestion.id, ExamOption.id)
+        .all()
+    )
+
+    key = AnswerKey(exam.content_version)
+    for question_id, marks, negative_marks, option_id, is_correct in rows:
+        negative_value = 0.0
+        if exam.negative_marking_enabled:
+            negative_value = float(negative_marks) if negative_marks is not None else default_negative
+        key.option_index[option_id] = len(key.question_ids)
+        key.question_ids.append(question_id)
+        key.correct.append(1 if is_correct else 0)
+        key.marks.append(float(marks) if marks is not None else 1.0)
+        key.negatives.append(negative_value)
+    return key
+
+
+def get_answer_key(db: Session, exam: Exam) -> AnswerKey:
+    """Return the cached key for ``exam`` or compile it.
+
+    Every question/option/exam edit bumps ``Exam.content_version``, so a key
+    compiled for an older version is simply replaced on the next lookup.
+    """
+    key = _answer_keys.get(exam.id)
+    if key is None or key.version != exam.content_version:
+        key = compile_answer_key(db, exam)
+        _answer_keys.set(exam.id, key)
+    return key
+
+
+def save_answers(db: Session, rows: list[dict]) -> None:
+    if rows:
+        db.execute(insert(ExamAnswer), rows)
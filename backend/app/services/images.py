@@ -0,0 +1,130 @@
+import asyncio
+import base64
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from app.core.config import settings
+
+# Pillow releases the GIL while decoding, resampling and encoding, so a small
+# dedicated pool keeps image work off the request threads and the event loop.
+_image_pool = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix="image")
+
+EXTENSIONS = {"AVIF": ".avif", "WEBP": ".webp", "JPEG": ".jpg"}
+MIME_TYPES = {"AVIF": "image/avif", "WEBP": "image/webp", "JPEG": "image/jpeg"}
+PLACEHOLDER_WIDTH = 16
+
+
+class InvalidImage(ValueError):
+    pass
+
+
+@dataclass
+class EncodedImage:
+    data: bytes
+    extension: str
+    width: int
+    height: int
+
+
+@dataclass
+class ImageVariants:
+    width: int
+    height: int
+    variants: dict[int, EncodedImage]
+    placeholder: str
+
+
+def parse_formats(value: str) -> list[str]:
+    return [fmt.strip().upper() for fmt in value.split(",") if fmt.strip()]
+
+
+def _pick_format(formats: list[str]) -> str:
+    from PIL import features
+
+    for fmt in formats:
+        if fmt == "JPEG" or (fmt in EXTENSIONS and features.check(fmt.lower())):
+            return fmt
+    return "JPEG"
+
+
+def _open(data: bytes, max_dimension: int):
+    """Open ``data`` upright; returns the image and the full-resolution upright size."""
+    from PIL import Image, ImageOps, UnidentifiedImageError
+
+    try:
+        image = Image.open(io.BytesIO(data))
+        width, height = image.size
+        if image.getexif().get(0x0112) in (5, 6, 7, 8):
+            width, height = height, width
+        # JPEG can decode straight at a reduced scale, which is most of the win on phone photos.
+        image.draft("RGB", (max_dimension * 2, max_dimension * 2))
+        image = ImageOps.exif_transpose(image)
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as exc:
+        raise InvalidImage(str(exc)) from exc
+    return image, (width, height)
+
+
+def _encode(image, fmt: str, quality: int) -> bytes:
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    if fmt == "JPEG" or not has_alpha:
+        image = image.convert("RGB")
+    elif image.mode != "RGBA":
+        image = image.convert("RGBA")
+
+    # Only pixels are written: EXIF (GPS, device, timestamps) and other metadata are dropped.
+    buffer = io.BytesIO()
+    options = {"quality": quality}
+    if fmt == "JPEG":
+        options.update(optimize=True, progressive=True)
+    elif fmt == "WEBP":
+        options.update(method=4)
+    image.save(buffer, format=fmt, **options)
+    return buffer.getvalue()
+
+
+def resize_image(data: bytes, max_dimension: int, formats: list[str], quality: int) -> EncodedImage:
+    """Decode ``data``, fit it inside ``max_dimension`` and re-encode it in the first supported format."""
+    from PIL import Image
+
+    image, _ = _open(data, max_dimension)
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+    fmt = _pick_format(formats)
+    return EncodedImage(_encode(image, fmt, quality), EXTENSIONS[fmt], image.width, image.height)
+
+
+def render_variants(data: bytes, widths: list[int], formats: list[str], quality: int) -> ImageVariants:
+    """Decode ``data`` once and encode a copy at each width narrower than the source.
+
+    ``placeholder`` is a blurred ``data:`` URI a few pixels wide, meant to be
+    inlined and stretched while the real image loads.
+    """
+    from PIL import Image, ImageFilter
+
+    image, (width, height) = _open(data, max(widths, default=PLACEHOLDER_WIDTH))
+
+    fmt = _pick_format(formats)
+    variants = {}
+    for target in sorted(set(widths), reverse=True):
+        if target >= width:
+            continue
+        image.thumbnail((target, image.height), Image.Resampling.LANCZOS)
+        variants[target] = EncodedImage(_encode(image, fmt, quality), EXTENSIONS[fmt], image.width, image.height)
+
+    image.thumbnail((PLACEHOLDER_WIDTH, PLACEHOLDER_WIDTH), Image.Resampling.BOX)
+    blurred = image.filter(ImageFilter.GaussianBlur(1))
+    encoded = base64.b64encode(_encode(blurred, fmt, 40)).decode()
+    return ImageVariants(width, height, variants, f"data:{MIME_TYPES[fmt]};base64,{encoded}")
+
+
+async def render_variants_async(
+    data: bytes,
+    widths: list[int],
+    formats: list[str],
+    quality: int,
+) -> ImageVariants:
+    return await asyncio.wrap_future(_image_pool.submit(render_variants, data, widths, formats, quality))
+
+
+async def resize_image_async(data: bytes, max_dimension: int, formats: list[str], quality: int) -> EncodedImage:
+    return await asyncio.wrap_future(_image_pool.submit(resize_image, data, max_dimension, formats, quality))
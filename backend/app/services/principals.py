@@ -0,0 +1,59 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.student import Student
+from app.models.user import User
+
+PRINCIPAL_MODELS = (User, Student)
+
+_principals = LRUCache(maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def _key(model, principal_id: int) -> tuple[str, int]:
+    return model.__tablename__, principal_id
+
+
+def get_principal(db: Session, model, principal_id: int):
+    """Load a user or student by id through a short TTL cache.
+
+    Hits return a transient copy, never an instance bound to another request's
+    session. Any flushed change to the row drops the entry (see below), and
+    the TTL bounds staleness for writes made by other workers.
+    """
+    snapshot = _principals.get(_key(model, principal_id))
+    if snapshot is None:
+        principal = db.query(model).filter(model.id == principal_id).first()
+        if principal is None:
+            return None
+        snapshot = {column.key: getattr(principal, column.key) for column in model.__table__.columns}
+        _principals.set(_key(model, principal_id), snapshot)
+    return model(**snapshot)
+
+
+def invalidate_principal(model, principal_id: int) -> None:
+    _principals.pop(_key(model, principal_id))
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_principal_changes(session: Session, flush_context) -> None:
+    keys = session.info.setdefault("principal_invalidations", set())
+    for obj in [*session.dirty, *session.deleted]:
+        if isinstance(obj, PRINCIPAL_MODELS) and obj.id is not None:
+            keys.add((type(obj), obj.id))
+            invalidate_principal(type(obj), obj.id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _apply_principal_changes(session: Session) -> None:
+    # Drop again after commit so a lookup racing the transaction cannot leave
+    # the pre-commit row cached.
+    for model, principal_id in session.info.pop("principal_invalidations", ()):
+        invalidate_principal(model, principal_id)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_principal_changes(session: Session) -> None:
+    session.info.pop("principal_invalidations", None)
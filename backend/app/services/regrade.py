@@ -0,0 +1,138 @@
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.exam import Exam, ExamAnswer, ExamAttempt, RegradeJob
+from app.services.grading import compile_answer_key
+
+logger = logging.getLogger(__name__)
+
+_ACTIVE = ("queued", "running")
+_FIELDS = ("exam_id", "status", "total", "processed", "started_at", "finished_at", "error")
+_table = RegradeJob.__table__
+
+
+def get_job(db: Session, exam_id: int) -> dict | None:
+    job = db.get(RegradeJob, exam_id)
+    return {name: getattr(job, name) for name in _FIELDS} if job else None
+
+
+def create_job(db: Session, exam_id: int) -> dict | None:
+    """Register a queued job for ``exam_id``; ``None`` if one is already active.
+
+    Jobs live in ``regrade_jobs`` so every worker sees the same state, and the
+    claim is a single conditional write so only one request can win it. An
+    active job that has not reported progress for ``REGRADE_STALE_SECONDS`` is
+    taken to belong to a worker that died and may be replaced.
+    """
+    now = datetime.utcnow()
+    job = {
+        "status": "queued",
+        "total": 0,
+        "processed": 0,
+        "started_at": None,
+        "finished_at": None,
+        "error": None,
+    }
+    stale_before = now - timedelta(seconds=settings.REGRADE_STALE_SECONDS)
+    claimed = db.execute(
+        update(_table)
+        .where(
+            _table.c.exam_id == exam_id,
+            or_(_table.c.status.notin_(_ACTIVE), _table.c.updated_at < stale_before),
+        )
+        .values(updated_at=now, **job)
+    )
+    if not claimed.rowcount:
+        try:
+            db.execute(_table.insert().values(exam_id=exam_id, updated_at=now, **job))
+        except IntegrityError:
+            db.rollback()
+            return None
+    db.commit()
+    return {"exam_id": exam_id, **job}
+
+
+def _update_job(db: Session, exam_id: int, **fields) -> None:
+    db.execute(
+        update(_table).where(_table.c.exam_id == exam_id).values(updated_at=datetime.utcnow(), **fields)
+    )
+
+
+def _regrade_chunk(db: Session, answer_key, attempt_ids: list[int]) -> None:
+    answers = (
+        db.query(ExamAnswer.id, ExamAnswer.attempt_id, ExamAnswer.question_id, ExamAnswer.option_id)
+        .filter(ExamAnswer.attempt_id.in_(attempt_ids))
+        .all()
+    )
+
+    totals = dict.fromkeys(attempt_ids, 0.0)
+    answer_rows = []
+    for answer_id, attempt_id, question_id, option_id in answers:
+        is_correct, marks_awarded = answer_key.score(question_id, option_id) or (False, 0.0)
+        totals[attempt_id] += marks_awarded
+        answer_rows.append({"id": answer_id, "is_correct": is_correct, "marks_awarded": marks_awarded})
+
+    db.bulk_update_mappings(ExamAnswer, answer_rows)
+    db.bulk_update_mappings(
+        ExamAttempt,
+        [{"id": attempt_id, "total_score": total} for attempt_id, total in totals.items()],
+    )
+
+
+def run_regrade(exam_id: int) -> None:
+    """Re-score every submitted attempt of an exam against its current answer key.
+
+    Attempts are walked in keyset order on ``id`` and each chunk is graded and
+    written in its own transaction, together with the job's progress, so memory
+    stays bounded by the chunk size.
+    """
+    db = SessionLocal()
+    try:
+        exam = db.query(Exam).filter(Exam.id == exam_id).first()
+        if not exam:
+            _update_job(db, exam_id, status="failed", error="Exam not found", finished_at=datetime.utcnow())
+            db.commit()
+            return
+
+        answer_key = compile_answer_key(db, exam)
+        submitted = db.query(ExamAttempt.id).filter(
+            ExamAttempt.exam_id == exam_id,
+            ExamAttempt.status == "submitted",
+        )
+        total = submitted.with_entities(func.count(ExamAttempt.id)).scalar() or 0
+        _update_job(db, exam_id, status="running", total=total, started_at=datetime.utcnow())
+        db.commit()
+
+        processed = 0
+        last_id = 0
+        while True:
+            attempt_ids = [
+                row[0]
+                for row in submitted.filter(ExamAttempt.id > last_id)
+                .order_by(ExamAttempt.id)
+                .limit(settings.REGRADE_CHUNK_SIZE)
+                .all()
+            ]
+            if not attempt_ids:
+                break
+            _regrade_chunk(db, answer_key, attempt_ids)
+            last_id = attempt_ids[-1]
+            processed += len(attempt_ids)
+            _update_job(db, exam_id, processed=processed)
+            db.commit()
+
+        _update_job(db, exam_id, status="completed", finished_at=datetime.utcnow())
+        db.commit()
+    except Exception as exc:
+        db.rollback()
+        logger.exception("Regrade of exam %s failed", exam_id)
+        _update_job(db, exam_id, status="failed", error=str(exc), finished_at=datetime.utcnow())
+        db.commit()
+    finally:
+        db.close()
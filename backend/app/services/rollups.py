@@ -0,0 +1,209 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import delete, event, func, inspect, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.expense import Expense
+from app.models.fee import Fee
+from app.models.finance import FinanceDailyRollup
+
+# kind -> (model, column used as the breakdown category)
+SOURCES = {
+    "fee": (Fee, "mode"),
+    "expense": (Expense, "category"),
+}
+KIND_BY_MODEL = {model: kind for kind, (model, _) in SOURCES.items()}
+
+Bucket = tuple[date, str, str]
+
+
+def _amount(value) -> Decimal:
+    return Decimal(str(value)) if value is not None else Decimal(0)
+
+
+def _values(obj, names: list[str], old: bool) -> list:
+    state = inspect(obj)
+    values = []
+    for name in names:
+        history = state.attrs[name].history
+        if old and history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(obj, name))
+    return values
+
+
+def _bucket(kind: str, day, category) -> Bucket | None:
+    # Undated entries have no day to roll up into and are left out.
+    if day is None:
+        return None
+    return day, kind, category or ""
+
+
+def _collect_deltas(session: Session) -> dict[Bucket, list]:
+    deltas: dict[Bucket, list] = defaultdict(lambda: [Decimal(0), 0])
+
+    def add(bucket: Bucket | None, amount: Decimal, entries: int) -> None:
+        if bucket is not None:
+            deltas[bucket][0] += amount
+            deltas[bucket][1] += entries
+
+    for obj in session.new:
+        kind = KIND_BY_MODEL.get(type(obj))
+        if kind:
+            day, category, amount = _values(obj, ["paid_on", SOURCES[kind][1], "amount"], old=False)
+            add(_bucket(kind, day, category), _amount(amount), 1)
+
+    for obj in session.deleted:
+        kind = KIND_BY_MODEL.get(type(obj))
+        if kind:
+            day, category, amount = _values(obj, ["paid_on", SOURCES[kind][1], "amount"], old=True)
+            add(_bucket(kind, day, category), -_amount(amount), -1)
+
+    for obj in session.dirty:
+        kind = KIND_BY_MODEL.get(type(obj))
+        if not kind:
+            continue
+        names = ["paid_on", SOURCES[kind][1], "amount"]
+        old_day, old_category, old_amount = _values(obj, names, old=True)
+        day, category, amount = _values(obj, names, old=False)
+        if (old_day, old_category, old_amount) == (day, category, amount):
+            continue
+        add(_bucket(kind, old_day, old_category), -_amount(old_amount), -1)
+        add(_bucket(kind, day, category), _amount(amount), 1)
+
+    return {bucket: delta for bucket, delta in deltas.items() if delta[0] or delta[1]}
+
+
+def _upsert(connection: Connection, bucket: Bucket, amount: Decimal, entries: int) -> None:
+    day, kind, category = bucket
+    table = FinanceDailyRollup.__table__
+    dialect = connection.dialect.name
+    if dialect in {"sqlite", "postgresql"}:
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(table).values(day=day, kind=kind, category=category, amount=amount, entries=entries)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["day", "kind", "category"],
+                set_={"amount": table.c.amount + amount, "entries": table.c.entries + entries},
+            )
+        )
+        return
+
+    result = connection.execute(
+        update(table)
+        .where(table.c.day == day, table.c.kind == kind, table.c.category == category)
+        .values(amount=table.c.amount + amount, entries=table.c.entries + entries)
+    )
+    if not result.rowcount:
+        connection.execute(
+            table.insert().values(day=day, kind=kind, category=category, amount=amount, entries=entries)
+        )
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _apply_rollup_deltas(session: Session, flush_context) -> None:
+    deltas = _collect_deltas(session)
+    if not deltas:
+        return
+    connection = session.connection()
+    for bucket, (amount, entries) in deltas.items():
+        _upsert(connection, bucket, amount, entries)
+
+
+def _lock_rollups(db: Session) -> None:
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        db.execute(text(f"LOCK TABLE {FinanceDailyRollup.__tablename__} IN SHARE ROW EXCLUSIVE MODE"))
+    elif dialect != "sqlite":
+        # InnoDB's locking read takes next-key locks, which also hold off inserts of new buckets.
+        db.execute(select(FinanceDailyRollup.id).with_for_update()).all()
+    # SQLite: the DELETE that follows takes the database write lock before anything is read.
+
+
+def rebuild_rollups(db: Session) -> None:
+    """Recompute every daily bucket from the fee and expense tables.
+
+    Rollup writers are locked out until the rebuild commits, so a fee written
+    meanwhile is either in the aggregates or applied on top of them afterwards
+    rather than lost, counted twice or colliding with a rebuilt bucket.
+    """
+    _lock_rollups(db)
+    db.execute(delete(FinanceDailyRollup))
+    for kind, (model, category_name) in SOURCES.items():
+        category = getattr(model, category_name)
+        rows = (
+            db.query(model.paid_on, category, func.sum(model.amount), func.count(model.id))
+            .filter(model.paid_on.isnot(None))
+            .group_by(model.paid_on, category)
+            .all()
+        )
+        db.bulk_insert_mappings(
+            FinanceDailyRollup,
+            [
+                {"day": day, "kind": kind, "category": value or "", "amount": amount, "entries": entries}
+                for day, value, amount, entries in rows
+            ],
+        )
+    db.commit()
+
+
+def _period(day: date, granularity: str) -> str:
+    if granularity == "month":
+        return day.strftime("%Y-%m")
+    return day.isoformat()
+
+
+def ensure_rollups() -> None:
+    """Build the rollups once for databases that had fees/expenses before they existed."""
+    db = SessionLocal()
+    try:
+        if db.query(FinanceDailyRollup.id).first():
+            return
+        if (
+            db.query(Fee.id).filter(Fee.paid_on.isnot(None)).first()
+            or db.query(Expense.id).filter(Expense.paid_on.isnot(None)).first()
+        ):
+            rebuild_rollups(db)
+    finally:
+        db.close()
+
+
+def finance_summary(db: Session, start: date | None, end: date | None, granularity: str) -> dict:
+    query = db.query(
+        FinanceDailyRollup.day,
+        FinanceDailyRollup.kind,
+        FinanceDailyRollup.category,
+        FinanceDailyRollup.amount,
+    ).filter(FinanceDailyRollup.entries > 0)
+    if start:
+        query = query.filter(FinanceDailyRollup.day >= start)
+    if end:
+        query = query.filter(FinanceDailyRollup.day <= end)
+
+    series: dict[str, dict[str, float]] = {}
+    breakdown = {"fee": defaultdict(float), "expense": defaultdict(float)}
+    for day, kind, category, amount in query.order_by(FinanceDailyRollup.day):
+        value = float(amount)
+        point = series.setdefault(_period(day, granularity), {"income": 0.0, "expense": 0.0})
+        point["income" if kind == "fee" else "expense"] += value
+        breakdown[kind][category or "unspecified"] += value
+
+    return {
+        "granularity": granularity,
+        "start": start,
+        "end": end,
+        "total_income": sum(breakdown["fee"].values()),
+        "total_expense": sum(breakdown["expense"].values()),
+        "series": [
+            {"period": period, "income": point["income"], "expense": point["expense"], "net": point["income"] - point["expense"]}
+            for period, point in series.items()
+        ],
+        "fees_by_mode": dict(breakdown["fee"]),
+        "expenses_by_category": dict(breakdown["expense"]),
+    }
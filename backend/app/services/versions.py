@@ -0,0 +1,60 @@
+from sqlalchemy import event, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.db.session import SessionLocal
+from app.models.collection_version import CollectionVersion
+
+_table = CollectionVersion.__table__
+
+# Only tables some ETag depends on are versioned; writes to anything else
+# (exam attempts, users, counters...) skip the extra upsert entirely.
+tracked_tables: set[str] = set()
+
+
+def track(names) -> None:
+    tracked_tables.update(names)
+
+
+def _bump(connection: Connection, names: set[str]) -> None:
+    dialect = connection.dialect.name
+    for name in sorted(names):
+        if dialect in {"sqlite", "postgresql"}:
+            insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            connection.execute(
+                insert(_table)
+                .values(name=name, version=1)
+                .on_conflict_do_update(index_elements=["name"], set_={"version": _table.c.version + 1})
+            )
+            continue
+        result = connection.execute(
+            update(_table).where(_table.c.name == name).values(version=_table.c.version + 1)
+        )
+        if not result.rowcount:
+            connection.execute(_table.insert().values(name=name, version=1))
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _bump_flushed_tables(session: Session, flush_context) -> None:
+    names = {obj.__table__.name for obj in session.new} | {obj.__table__.name for obj in session.deleted}
+    names |= {obj.__table__.name for obj in session.dirty if session.is_modified(obj)}
+    names &= tracked_tables
+    if names:
+        _bump(session.connection(), names)
+
+
+@event.listens_for(SessionLocal, "do_orm_execute")
+def _bump_bulk_tables(state) -> None:
+    # query(...).update()/delete() bypass the flush, so catch them here.
+    if (state.is_update or state.is_delete) and state.bind_mapper is not None:
+        name = state.bind_mapper.local_table.name
+        if name in tracked_tables:
+            _bump(state.session.connection(), {name})
+
+
+def read_versions(db: Session, names: list[str]) -> dict[str, int]:
+    rows = db.query(CollectionVersion.name, CollectionVersion.version).filter(CollectionVersion.name.in_(names))
+    versions = dict.fromkeys(names, 0)
+    versions.update(dict(rows.all()))
+    return versions
@@ -0,0 +1,61 @@
+"""Import-time report for a cold worker.
+
+Runs ``python -X importtime -c "import app.main"`` in a fresh interpreter and
+prints the total plus the slowest modules by cumulative time.
+
+    python benchmarks/importtime.py --top 25 --budget-ms 600
+
+Exits non-zero when the total exceeds ``--budget-ms``.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def measure(module: str) -> list[tuple[str, int, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if not self_us.isdigit():
+            continue
+        rows.append((name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    total_ms = next(cumulative for name, _, cumulative in rows if name == args.module) / 1000
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[: args.top]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {name.strip()}")
+    print(f"\nimport {args.module}: {total_ms:.1f} ms")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"over budget by {total_ms - args.budget_ms:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import os
+import tempfile
+
+# Settings are read at import time, so the throwaway database has to be in
+# place before anything under app/ is imported.
+_tmp = tempfile.mkdtemp(prefix="pragati-tests-")
+os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{_tmp}/test.db"
+os.environ.setdefault("BCRYPT_ROUNDS_STAFF", "4")
+os.environ.setdefault("BCRYPT_ROUNDS_STUDENT", "4")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from app.db import session as session_mod  # noqa: E402
+from app.main import app  # noqa: E402
+
+API = "/api/v1"
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def queries():
+    """SQL statements issued by either the sync or the async engine while the test runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engines = (session_mod.engine, session_mod.async_engine.sync_engine)
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client):
+    client.post(API + "/auth/register", json={"name": "Admin", "email": "admin@example.com", "password": "pw"})
+    response = client.post(API + "/auth/login", json={"email": "admin@example.com", "password": "pw"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def make_student(client, admin_headers):
+    def create(enrollment_no: str):
+        response = client.post(
+            API + "/students/",
+            json={"name": "Student", "phone": "1", "enrollment_no": enrollment_no, "dob": "2000-01-01"},
+            headers=admin_headers,
+        )
+        student_id = response.json()["id"]
+        client.post(API + f"/students/{student_id}/set-password", data={"password": "pw"}, headers=admin_headers)
+        login = client.post(API + "/student-auth/login", json={"enrollment_no": enrollment_no, "password": "pw"})
+        return student_id, {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+    return create
+
+
+@pytest.fixture
+def make_exam(client, admin_headers):
+    def create(question_count: int) -> int:
+        exam = client.post(API + "/exams/", json={"title": "Exam", "duration_minutes": 30}, headers=admin_headers)
+        exam_id = exam.json()["id"]
+        for index in range(question_count):
+            response = client.post(
+                API + f"/exams/{exam_id}/questions",
+                json={
+                    "question_text": f"Question {index}",
+                    "marks": 2,
+                    "options": [{"option_text": "a", "is_correct": True}, {"option_text": "b"}],
+                },
+                headers=admin_headers,
+            )
+            assert response.status_code == 200, response.text
+        return exam_id
+
+    return create
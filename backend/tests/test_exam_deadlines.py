@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.db.session import SessionLocal
+from app.models.exam import Exam, ExamAttempt
+from app.services.exam_sweeper import attempt_deadline, sweep_expired_attempts
+from tests.conftest import API
+
+
+def test_late_submit_is_rejected_and_left_to_the_sweeper(client, make_student, make_exam):
+    _, student_headers = make_student("LATE-1")
+    exam_id = make_exam(2)
+    started = client.post(API + f"/exams/{exam_id}/start", headers=student_headers).json()
+    attempt_id = started["attempt_id"]
+    answers = [
+        {"question_id": question["id"], "option_id": question["options"][0]["id"]}
+        for question in started["questions"]
+    ]
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(ExamAttempt)
+            .where(ExamAttempt.id == attempt_id)
+            .values(started_at=datetime.utcnow() - timedelta(hours=1))
+        )
+        db.commit()
+
+        response = client.post(
+            API + f"/exams/{exam_id}/submit",
+            json={"attempt_id": attempt_id, "answers": answers},
+            headers=student_headers,
+        )
+        assert response.status_code == 400
+        assert db.get(ExamAttempt, attempt_id).status == "in_progress"
+
+        sweep_expired_attempts()
+        db.expire_all()
+        attempt = db.get(ExamAttempt, attempt_id)
+        assert attempt.status == "submitted"
+        assert attempt.total_score == 0
+    finally:
+        db.close()
+
+
+def test_deadline_converts_aware_end_at_to_utc():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    exam = Exam(duration_minutes=600, end_at=datetime(2026, 1, 1, 12, 0, tzinfo=ist))
+    assert attempt_deadline(exam, datetime(2026, 1, 1, 5, 0)) == datetime(2026, 1, 1, 6, 30)
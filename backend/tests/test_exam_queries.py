@@ -0,0 +1,27 @@
+from tests.conftest import API
+
+
+def _counts(client, queries, admin_headers, student_headers, exam_id, question_count):
+    queries.clear()
+    response = client.get(API + f"/exams/{exam_id}/questions", headers=admin_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == question_count
+    list_count = len(queries)
+
+    queries.clear()
+    response = client.post(API + f"/exams/{exam_id}/start", headers=student_headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()["questions"]) == question_count
+    assert not any(option["is_correct"] for question in response.json()["questions"] for option in question["options"])
+    return list_count, len(queries)
+
+
+def test_query_count_does_not_grow_with_questions(client, queries, admin_headers, make_student, make_exam):
+    _, student_headers = make_student("QCOUNT-1")
+    # Warm the principal cache so both measurements start from the same state.
+    client.get(API + "/exams/student/available", headers=student_headers)
+
+    small = _counts(client, queries, admin_headers, student_headers, make_exam(3), 3)
+    large = _counts(client, queries, admin_headers, student_headers, make_exam(30), 30)
+
+    assert small == large
@@ -0,0 +1,40 @@
+import io
+from uuid import uuid4
+
+from PIL import Image
+
+from app.api.v1.routes.gallery import UPLOAD_DIR
+from app.services.gallery_variants import variant_paths
+from tests.conftest import API
+
+
+def _jpeg() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), "teal").save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def test_changing_url_replaces_the_variants(client, admin_headers):
+    uploaded = client.post(
+        API + "/gallery/upload",
+        files={"file": ("first.jpg", _jpeg(), "image/jpeg")},
+        headers=admin_headers,
+    ).json()
+    old_url = uploaded["url"]
+    assert variant_paths(UPLOAD_DIR, old_url)
+
+    new_url = f"/uploads/{uuid4().hex}.jpg"
+    (UPLOAD_DIR / new_url.rsplit("/", 1)[1]).write_bytes(_jpeg())
+    try:
+        response = client.put(API + f"/gallery/{uploaded['id']}", json={"url": new_url}, headers=admin_headers)
+        assert response.status_code == 200
+
+        assert not variant_paths(UPLOAD_DIR, old_url)
+        items = client.get(API + "/gallery/", params={"fields": "url,srcset"}).json()
+        item = next(item for item in items if item["id"] == uploaded["id"])
+        assert item["srcset"] and all(
+            url == new_url or url.startswith(new_url.rsplit(".", 1)[0]) for url in item["srcset"].values()
+        )
+    finally:
+        client.delete(API + f"/gallery/{uploaded['id']}", headers=admin_headers)
+        (UPLOAD_DIR / old_url.rsplit("/", 1)[1]).unlink(missing_ok=True)
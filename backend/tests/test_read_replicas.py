@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from app.db import replicas
+from app.db.session import engine
+from tests.conftest import API
+
+
+@pytest.fixture
+def replica(tmp_path):
+    """A second SQLite file holding a snapshot of the primary, standing in for a lagging replica."""
+    path = tmp_path / "replica.db"
+    with engine.connect() as conn:
+        conn.exec_driver_sql(f"VACUUM INTO '{path}'")
+    replicas.configure_replicas([f"sqlite:///{path}"])
+    yield path
+    for dropped in replicas.configure_replicas([]):
+        asyncio.run(dropped.dispose())
+
+
+def test_reads_use_replica_except_for_the_writing_client(client, admin_headers, make_student, replica):
+    student_id, _ = make_student("REPLICA-1")
+    course = client.post(API + "/courses/", json={"title": "Replica course", "fee": 10}, headers=admin_headers)
+
+    written = client.post(
+        API + "/certificates/",
+        json={"certificate_code": "REPLICA-CODE", "student_id": student_id, "course_id": course.json()["id"]},
+        headers=admin_headers,
+    )
+    assert written.status_code == 200
+    pinned = {replicas.PRIMARY_HEADER: written.headers[replicas.PRIMARY_HEADER]}
+
+    # The writer echoes the header and reads its own write from the primary.
+    assert client.get(API + "/certificates/verify/REPLICA-CODE", headers=pinned).status_code == 200
+
+    # Other clients, including ones served by the same worker, read the stale replica.
+    assert client.get(API + "/certificates/verify/REPLICA-CODE").status_code == 404
+    expired = {replicas.PRIMARY_HEADER: "1"}
+    assert client.get(API + "/certificates/verify/REPLICA-CODE", headers=expired).status_code == 404
+
+
+def test_pinned_reads_bypass_a_cache_refilled_from_the_replica(client, admin_headers, replica):
+    written = client.post(API + "/courses/", json={"title": "Cached course", "fee": 10}, headers=admin_headers)
+    pinned = {replicas.PRIMARY_HEADER: written.headers[replicas.PRIMARY_HEADER]}
+
+    def titles(response):
+        return [course["title"] for course in response.json()]
+
+    # The write invalidated the cache; an unpinned reader refills it from the replica.
+    assert "Cached course" not in titles(client.get(API + "/courses/"))
+    assert "Cached course" in titles(client.get(API + "/courses/", headers=pinned))
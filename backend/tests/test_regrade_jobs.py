@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.exam import RegradeJob
+from tests.conftest import API
+
+
+def _set_job(exam_id: int, **fields) -> None:
+    # Stands in for another worker process: it only shares the database.
+    db = SessionLocal()
+    try:
+        db.execute(update(RegradeJob).where(RegradeJob.exam_id == exam_id).values(**fields))
+        db.commit()
+    finally:
+        db.close()
+
+
+def test_regrade_job_state_is_shared_through_the_database(client, admin_headers, make_exam):
+    exam_id = make_exam(2)
+    url = API + f"/exams/{exam_id}/regrade"
+    assert client.get(url, headers=admin_headers).status_code == 404
+
+    assert client.post(url, headers=admin_headers).status_code == 200
+    assert client.get(url, headers=admin_headers).json()["status"] == "completed"
+
+    _set_job(exam_id, status="running", updated_at=datetime.utcnow())
+    assert client.post(url, headers=admin_headers).status_code == 409
+
+    stale = datetime.utcnow() - timedelta(seconds=settings.REGRADE_STALE_SECONDS + 1)
+    _set_job(exam_id, updated_at=stale)
+    assert client.post(url, headers=admin_headers).status_code == 200
+    assert client.get(url, headers=admin_headers).json()["status"] == "completed"
@@ -1,5 +1,6 @@
 import axios from "axios";
 import { clearStudentToken, getStudentToken } from "../utils/studentAuth.js";
+import { rememberReadPrimary, withReadPrimary } from "../utils/readPrimary.js";
 
 const studentApi = axios.create({
   baseURL: import.meta.env.VITE_API_BASE_URL || "http://localhost:8001/api/v1",
@@ -11,11 +12,11 @@ studentApi.interceptors.request.use((config) => {
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
-  return config;
+  return withReadPrimary(config);
 });
 
 studentApi.interceptors.response.use(
-  (response) => response,
+  rememberReadPrimary,
   (error) => {
     if (error.response?.status === 401) {
       clearStudentToken();
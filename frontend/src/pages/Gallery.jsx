@@ -11,6 +11,8 @@ export default function Gallery() {
   const [items, setItems] = useState([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const apiBase = import.meta.env.VITE_API_BASE_URL || "http://localhost:8001/api/v1";
   const mediaBase = apiBase.replace(/\/api\/v1\/?$/, "");
 
@@ -20,6 +22,11 @@ export default function Gallery() {
     return `${mediaBase}${url}`;
   };
 
+  const resolveSrcSet = (srcset) =>
+    Object.entries(srcset || {})
+      .map(([width, url]) => `${resolveMediaUrl(url)} ${width}`)
+      .join(", ");
+
   useEffect(() => {
     let active = true;
     setLoading(true);
@@ -28,6 +35,7 @@ export default function Gallery() {
       .then((response) => {
         if (!active) return;
         setItems(response.data);
+        setNextCursor(response.headers["x-next-cursor"] || null);
         setError("");
       })
       .catch(() => {
@@ -44,6 +52,20 @@ export default function Gallery() {
     };
   }, []);
 
+  // The list is keyset-paginated; further pages are fetched from the cursor the API returns.
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await api.get("/gallery", { params: { cursor: nextCursor } });
+      setItems((prev) => [...prev, ...response.data]);
+      setNextCursor(response.headers["x-next-cursor"] || null);
+    } catch (err) {
+      setError("Unable to load more gallery items.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   return (
     <div className="page">
       <section className="section">
@@ -74,6 +96,15 @@ export default function Gallery() {
                             <img
                               className="gallery-media-item"
                               src={resolveMediaUrl(item.url)}
+                              srcSet={item.srcset ? resolveSrcSet(item.srcset) : undefined}
+                              sizes="(max-width: 640px) 100vw, (max-width: 1024px) 50vw, 33vw"
+                              loading="lazy"
+                              decoding="async"
+                              style={
+                                item.placeholder
+                                  ? { backgroundImage: `url(${item.placeholder})`, backgroundSize: "cover" }
+                                  : undefined
+                              }
                               alt={item.title || "Gallery"}
                             />
                           )
@@ -90,6 +121,13 @@ export default function Gallery() {
               ) : (
                 <div className="status">Gallery updates will be added soon.</div>
               )}
+              {nextCursor && (
+                <div className="gallery-more">
+                  <button className="btn btn-ghost" type="button" onClick={loadMore} disabled={loadingMore}>
+                    {loadingMore ? "Loading..." : "Load more"}
+                  </button>
+                </div>
+              )}
             </>
           )}
         </div>
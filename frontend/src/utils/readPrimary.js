@@ -0,0 +1,20 @@
+// After a write the API returns an X-Read-Primary deadline; echoing it on later
+// requests keeps this client's reads on the primary until replicas catch up.
+// A header is used rather than a cookie because the API is on another origin.
+const HEADER = "X-Read-Primary";
+let readPrimaryUntil = null;
+
+export const withReadPrimary = (config) => {
+  if (readPrimaryUntil) {
+    config.headers[HEADER] = readPrimaryUntil;
+  }
+  return config;
+};
+
+export const rememberReadPrimary = (response) => {
+  const until = response.headers[HEADER.toLowerCase()];
+  if (until) {
+    readPrimaryUntil = until;
+  }
+  return response;
+};